@@ -0,0 +1,100 @@
+"""
+Lightweight image dimension sniffing straight from header bytes.
+
+Reads the size of PNG, GIF, JPEG, and WebP payloads with a handful of
+struct.unpack calls instead of a full PIL format dispatch, so dimension
+filters can reject candidates after the first few KB of a stream.
+"""
+import struct
+from typing import Optional, Tuple
+
+# JPEG start-of-frame markers that carry dimensions (all SOFn except the
+# DHT/JPG/DAC markers that share the 0xC0 range)
+_SOF_MARKERS = frozenset(
+    marker for marker in range(0xC0, 0xD0) if marker not in (0xC4, 0xC8, 0xCC)
+)
+
+
+def sniff_size(data) -> Optional[Tuple[int, int]]:
+    """
+    Return (width, height) parsed from the header of a PNG, GIF, JPEG,
+    or WebP buffer, or None when the format is unrecognized or the
+    buffer does not yet hold enough bytes. Callers fall back to a full
+    decoder on None.
+    """
+    if len(data) < 12:
+        return None
+    if data[:8] == b'\x89PNG\r\n\x1a\n':
+        return _png_size(data)
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return _gif_size(data)
+    if data[:2] == b'\xff\xd8':
+        return _jpeg_size(data)
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return _webp_size(data)
+    return None
+
+
+def _png_size(data):
+    """IHDR is always the first chunk: width/height at bytes 16-24."""
+    if len(data) < 24:
+        return None
+    width, height = struct.unpack('>II', bytes(data[16:24]))
+    return width, height
+
+
+def _gif_size(data):
+    """Logical screen descriptor directly follows the 6-byte signature."""
+    if len(data) < 10:
+        return None
+    width, height = struct.unpack('<HH', bytes(data[6:10]))
+    return width, height
+
+
+def _jpeg_size(data):
+    """Walk marker segments until a start-of-frame carries dimensions."""
+    offset = 2
+    end = len(data)
+    while offset + 4 <= end:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+
+        # Standalone markers (RSTn, EOI and padding) have no length field
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if 0xD0 <= marker <= 0xD9:
+            offset += 2
+            continue
+
+        if marker in _SOF_MARKERS:
+            if offset + 9 > end:
+                return None
+            height, width = struct.unpack('>HH', bytes(data[offset + 5:offset + 9]))
+            return width, height
+
+        length = struct.unpack('>H', bytes(data[offset + 2:offset + 4]))[0]
+        offset += 2 + length
+    return None
+
+
+def _webp_size(data):
+    """Dispatch on the VP8/VP8L/VP8X chunk following the RIFF header."""
+    if len(data) < 30:
+        return None
+    fourcc = bytes(data[12:16])
+    if fourcc == b'VP8X':
+        # Extended header: 24-bit little-endian width/height minus one
+        width = int.from_bytes(bytes(data[24:27]), 'little') + 1
+        height = int.from_bytes(bytes(data[27:30]), 'little') + 1
+        return width, height
+    if fourcc == b'VP8 ':
+        width, height = struct.unpack('<HH', bytes(data[26:30]))
+        return width & 0x3FFF, height & 0x3FFF
+    if fourcc == b'VP8L':
+        bits = struct.unpack('<I', bytes(data[21:25]))[0]
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        return width, height
+    return None
@@ -1,34 +1,273 @@
 import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util import connection as _urllib3_connection
+import socket
+from cachetools import TTLCache
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+try:
+    # lexbor-based C parser, roughly an order of magnitude faster than
+    # bs4 on big pages; bs4+lxml remains the fallback
+    from selectolax.parser import HTMLParser as _LexborParser
+except ImportError:
+    _LexborParser = None
+from urllib.parse import urljoin as _urljoin, urlparse as _urlparse, urlsplit
+import functools
 import logging
 import time
-from PIL import Image
 from io import BytesIO
 import hashlib
+import mimetypes
+import numpy as np
+try:
+    import ahocorasick
+except ImportError:
+    # Optional C extension; the regex-union fallback below covers its job
+    ahocorasick = None
 import argparse
 from typing import Set, List, Tuple
 import json
+try:
+    # Rust/SIMD JSON parser; cuts config parse time severalfold
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+import pickle
 import glob
+import itertools
 import subprocess
 import sys
 import tempfile
+import threading
+import asyncio
+import aiohttp
+try:
+    # HTTP/2 client: multiplexes many image GETs over one TLS connection
+    import httpx
+except ImportError:
+    httpx = None
 import concurrent.futures
+from collections import defaultdict, deque
+from aiolimiter import AsyncLimiter
+from image_sniff import sniff_size
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# A crawl parses and joins the same handful of URLs over and over; memoized
+# wrappers skip the repeated splitting work. urljoin sees far more distinct
+# (base, href) pairs than urlparse sees URLs, hence the larger cache.
+urlparse = functools.lru_cache(maxsize=8192)(_urlparse)
+urljoin = functools.lru_cache(maxsize=32768)(_urljoin)
+
+# TTL-bounded resolver cache for the sync requests path; the aiohttp
+# connector handles the async path with ttl_dns_cache. A crawl stays on
+# one base host, so after the first dial this hits nearly 100%.
+_DNS_CACHE = TTLCache(maxsize=256, ttl=300)
+_DNS_LOCK = threading.Lock()
+
+
+def _install_dns_cache():
+    """
+    Route urllib3's TCP dialing through the resolver cache so the crawl
+    host resolves once instead of per request. Only the dial target is
+    substituted; urllib3 still applies SNI and certificate hostname
+    checks against the original host.
+    """
+    original = _urllib3_connection.create_connection
+
+    def create_connection(address, *args, **kwargs):
+        host, port = address
+        try:
+            with _DNS_LOCK:
+                ip = _DNS_CACHE.get((host, port))
+            if ip is None:
+                ip = socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)[0][4][0]
+                with _DNS_LOCK:
+                    _DNS_CACHE[(host, port)] = ip
+            return original((ip, port), *args, **kwargs)
+        except Exception:
+            return original(address, *args, **kwargs)
+
+    _urllib3_connection.create_connection = create_connection
+
+
+_install_dns_cache()
+
+# One adapter (and its urllib3 pools) shared by every ImageDownloader in
+# the process; HTTPAdapter is thread-safe, and batch runs over many sites
+# stop re-paying adapter construction and pool setup per instance
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504]
+)
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=128,
+    max_retries=_RETRY
+)
+
+# Ceiling on how many bytes of a single image we are willing to read
+MAX_IMAGE_BYTES = 25 * 1024 * 1024
+
+# Default number of pages fetched concurrently while crawling a site
+CRAWL_WORKERS = 16
+
+# Concurrent in-flight requests against a single host
+PER_HOST_CONCURRENCY = 20
+
+# Maximum Hamming distance between perceptual hashes to count as duplicates
+PHASH_MAX_DISTANCE = 4
+
+# Precompiled patterns used on every parsed page
+_BG_IMAGE_RE = re.compile(r'background-image:\s*url\([\'"]?([^\'"()]+)[\'"]?\)')
+_BG_SHORTHAND_RE = re.compile(r'background:\s*[^;]*url\([\'"]?([^\'"()]+)[\'"]?\)')
+_SCRIPT_IMG_URL_RE = re.compile(r'https?://[^"\']+\.(?:jpg|jpeg|png|gif|webp)')
+_IMAGE_HREF_RE = re.compile(r'\.(?:jpg|jpeg|png|gif|webp)$', re.IGNORECASE)
+_SCHEME_RE = re.compile(r'^https?://', re.ASCII | re.IGNORECASE)
+
+
+def _ensure_scheme(url: str) -> str:
+    """Prepend https:// when the URL lacks an http(s) scheme."""
+    if _SCHEME_RE.match(url):
+        return url
+    return 'https://' + url
+
+# URL substrings that indicate icons/decoration rather than content images
+ICON_PATTERNS = ('icon', 'logo', 'button', 'bg-', 'background')
+
+# Superset of ICON_PATTERNS screened against candidate URLs before any
+# network I/O is spent on them
+_BAD_SUBSTRINGS = frozenset(
+    ['icon', 'logo', 'button', 'bg-', 'background', 'sprite', 'favicon', 'pixel.gif']
+)
+
+
+def _looks_like_image_url(url: str) -> bool:
+    """
+    Cheap pre-network screen for image candidates: reject URLs carrying
+    decoration markers, and URLs whose extension maps to a known
+    non-image MIME type. Extension-less URLs pass - the Content-Type
+    check on the response settles those.
+    """
+    lowered = url.lower()
+    if any(bad in lowered for bad in _BAD_SUBSTRINGS):
+        return False
+    guessed, _ = mimetypes.guess_type(urlparse(url).path)
+    if guessed and not guessed.startswith('image/'):
+        return False
+    return True
+
+def _normalize_image_url(url: str) -> str:
+    """Canonical form for dedup: no query/fragment, lowercased host."""
+    parts = urlsplit(url)
+    return parts._replace(query='', fragment='', netloc=parts.netloc.lower()).geturl()
+
+
+# C-level character maps for building filesystem-safe folder names
+_PATH_TRANS = str.maketrans({c: '_' for c in '\\/*?:"<>|'})
+_DOMAIN_TRANS = str.maketrans({'.': '_'})
+
+# Keywords marking links worth following while hunting for hotel imagery
+PRIORITY_KEYWORDS = [
+    'room', 'suite', 'accommodation', 'stay', 'lodging',
+    'facility', 'amenity', 'service', 'spa', 'restaurant',
+    'dining', 'gallery', 'photo', 'image', 'tour'
+]
+
+# The landing-page scan also considers general info pages
+LANDING_KEYWORDS = PRIORITY_KEYWORDS + ['about', 'location', 'contact']
+
+
+def _build_matcher(keywords):
+    """
+    Build a single-pass matcher for the keyword list: an Aho-Corasick
+    automaton when pyahocorasick is installed, otherwise the keyword
+    list partial-evaluated into one compiled regex union. Either way a
+    lookup is one C-level scan instead of |keywords| Python substring
+    checks.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+_PRIORITY_MATCHER = _build_matcher(PRIORITY_KEYWORDS)
+_LANDING_MATCHER = _build_matcher(LANDING_KEYWORDS)
+
+
+def _has_keyword(matcher, text: str) -> bool:
+    """True if any matcher keyword occurs in text (single scan)."""
+    if ahocorasick is not None:
+        for _ in matcher.iter(text):
+            return True
+        return False
+    return matcher.search(text) is not None
+
+
+def _phash64(pil_img) -> int:
+    """
+    DCT-based 64-bit perceptual hash: 32x32 grayscale -> 2D DCT -> top-left
+    8x8 block binarized against its median. Computed entirely with
+    NumPy/SciPy vectorized ops, so it runs in ~100us per image instead of
+    the per-pixel Python loops of general-purpose hashing libraries.
+    """
+    # Deferred import: SciPy is only paid for once hashing actually runs
+    import scipy.fft
+    from PIL import Image
+
+    a = np.asarray(pil_img.convert('L').resize((32, 32), Image.BILINEAR), dtype=np.float32)
+    d = scipy.fft.dctn(a, type=2, norm='ortho')[:8, :8]
+    bits = (d > np.median(d)).flatten()
+    return int(np.packbits(bits).view('>u8')[0])
+
+
+def _decode_and_hash(data: bytes) -> int:
+    """
+    Full pixel decode plus perceptual hash of an image body. Module-level
+    so it can run in a worker process, keeping the GIL-holding parts of
+    PIL and the hashing off the event loop.
+    """
+    from PIL import Image
+
+    return _phash64(Image.open(BytesIO(data)))
+
+
+def _write_image_bytes(path: str, data: bytes):
+    """
+    Write an image body atomically: one os.write to a sibling temp file,
+    then rename over the final path, so an interrupted crawl never
+    leaves truncated images behind. Saved bodies are rarely re-read, so
+    their pages are dropped from the cache right away where supported.
+    """
+    tmp_path = path + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, len(data), os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
 class ImageDownloader:
-    def __init__(self, base_url, unique_id=None, min_width=800, min_height=600, min_size_kb=50, delay=1.0, max_pages=20):
+    def __init__(self, base_url, unique_id=None, min_width=800, min_height=600, min_size_kb=50, delay=1.0, max_pages=20, concurrency=CRAWL_WORKERS, connections=32):
         self.base_url = base_url
         self.min_width = min_width
         self.min_height = min_height
         self.min_size_kb = min_size_kb
         self.delay = delay
         self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.connections = connections
         
         # Extract domain for folder name
         parsed_url = urlparse(base_url)
@@ -50,8 +289,7 @@ class ImageDownloader:
         os.makedirs(self.images_base_dir, exist_ok=True)
         
         self.image_dir = os.path.join(self.images_base_dir, folder_name)
-        if not os.path.exists(self.image_dir):
-            os.makedirs(self.image_dir, exist_ok=True)
+        os.makedirs(self.image_dir, exist_ok=True)
         
         # Track visited URLs and downloaded images
         self.visited_urls = set()
@@ -69,20 +307,128 @@ class ImageDownloader:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
-    
+
+        # Shared session with connection pooling and keep-alive so repeated
+        # requests to the same host (typical for hotel sites and their CDNs)
+        # reuse TCP/TLS connections instead of handshaking every time
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('http://', _SHARED_ADAPTER)
+        self.session.mount('https://', _SHARED_ADAPTER)
+
+        # Perceptual hashes of saved images as a flat uint64 array; the
+        # duplicate check XORs the whole array at once and popcounts in
+        # NumPy, which vectorizes far better than per-hash Python loops
+        self._phashes = np.empty(0, dtype=np.uint64)
+        self._phash_lock = threading.Lock()
+
+        # Normalized URLs and body digests already fetched/saved, loaded
+        # from earlier runs so incremental crawls skip repeat work
+        self._seen_path = os.path.join(self.image_dir, '.seen.json')
+        self._seen_urls, self._seen_digests = self._load_seen()
+
+        # Cache validators from previous runs; re-crawls turn unchanged
+        # images into zero-byte 304 exchanges
+        self._etag_path = os.path.join(self.image_dir, '.etags.json')
+        self._etags = self._load_etags()
+
+        # Bounded memo of parse results keyed by body digest; retried
+        # fetches and shared page templates skip the re-parse
+        self._parse_memo = {}
+
+    def _load_etags(self) -> dict:
+        """Load the persisted URL -> (ETag, Last-Modified) map, if any."""
+        try:
+            with open(self._etag_path, 'rb') as f:
+                return _json_loads(f.read())
+        except Exception:
+            return {}
+
+    def _save_etags(self):
+        """Persist cache validators for the next run."""
+        try:
+            with open(self._etag_path, 'w', encoding='utf-8') as f:
+                json.dump(self._etags, f)
+        except Exception as e:
+            logger.debug(f"Could not persist etag index: {e}")
+
+    def _conditional_headers(self, url: str) -> dict:
+        """Validator headers for a URL seen in an earlier run, if known."""
+        validators = self._etags.get(url)
+        if not validators:
+            return {}
+        headers = {}
+        etag, last_modified = validators
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _record_validators(self, url: str, headers):
+        """Remember the response's cache validators for future runs."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag or last_modified:
+            self._etags[url] = [etag, last_modified]
+
+    def _load_seen(self):
+        """Load the persisted seen-URL and body-digest sets, if any."""
+        try:
+            with open(self._seen_path, 'r', encoding='utf-8') as f:
+                seen = json.load(f)
+            return set(seen.get('urls', [])), set(seen.get('digests', []))
+        except Exception:
+            return set(), set()
+
+    def _save_seen(self):
+        """Persist the seen-URL and body-digest sets for the next run."""
+        try:
+            with open(self._seen_path, 'w', encoding='utf-8') as f:
+                json.dump({'urls': sorted(self._seen_urls),
+                           'digests': sorted(self._seen_digests)}, f)
+        except Exception as e:
+            logger.debug(f"Could not persist seen index: {e}")
+
+    def _already_fetched(self, url: str) -> bool:
+        """
+        Check the normalized URL index (query/fragment stripped, host
+        lowercased), catching the same logo or sprite referenced with
+        varying cache-buster parameters.
+        """
+        return _normalize_image_url(url) in self._seen_urls
+
+    def _mark_fetched(self, url: str):
+        """
+        Record a URL as fetched only once its outcome is definitive, so
+        transient failures (timeouts, resets, 5xx) stay retryable on the
+        next run instead of being persisted as done.
+        """
+        self._seen_urls.add(_normalize_image_url(url))
+
+    def _settle_url(self, url: str, headers):
+        """
+        The outcome for a URL is known for good — either its headers
+        rejected it or its body streamed in full. Record it as fetched
+        and remember its cache validators.
+        """
+        self._mark_fetched(url)
+        self._record_validators(url, headers)
+
+
     def _get_folder_name_from_url(self, url):
         """Generate a safe folder name from a URL."""
         parsed_url = urlparse(url)
         
         # Start with the domain
-        folder_name = parsed_url.netloc.replace(".", "_")
-        
+        folder_name = parsed_url.netloc.translate(_DOMAIN_TRANS)
+
         # Add the path if it exists (but clean it up)
         if parsed_url.path and parsed_url.path != "/":
             # Remove leading and trailing slashes
             path = parsed_url.path.strip("/")
             # Replace special characters
-            path = re.sub(r'[\\/*?:"<>|]', "_", path)
+            path = path.translate(_PATH_TRANS)
             # Limit length
             if len(path) > 50:
                 path = path[:50]
@@ -122,495 +468,812 @@ class ImageDownloader:
         except:
             return False
     
-    def get_image_info(self, img_url: str) -> Tuple[bool, str, int, int, int]:
+    async def _fetch_if_valid(self, session, img_url: str, _retried: bool = False):
         """
-        Get image information and check if it meets the minimum requirements.
-        
+        Fetch an image with a single streamed GET and validate it against
+        the content-type, size, and dimension filters.
+
         Returns:
-            Tuple of (is_valid, content_type, width, height, size_bytes)
+            Tuple of (data, content_type, width, height) if the image passes
+            all filters, or None if it was rejected or could not be fetched.
         """
+        from PIL import Image, ImageFile
+
         try:
-            # Send a HEAD request first to check content type and size
-            head_response = requests.head(img_url, headers=self.headers, timeout=10)
-            
-            # Check if it's an image
-            content_type = head_response.headers.get('Content-Type', '')
-            if not content_type.startswith('image/'):
-                return False, content_type, 0, 0, 0
-            
-            # Check file size if available
-            content_length = int(head_response.headers.get('Content-Length', 0))
-            if content_length > 0 and content_length < self.min_size_kb * 1024:
-                return False, content_type, 0, 0, content_length
-            
-            # If we can't determine size from headers or it's large enough, download the image
-            response = requests.get(img_url, headers=self.headers, timeout=10)
-            img_data = BytesIO(response.content)
-            
-            # Check actual file size
-            size_bytes = len(response.content)
-            if size_bytes < self.min_size_kb * 1024:
-                return False, content_type, 0, 0, size_bytes
-            
-            # Check dimensions
-            img = Image.open(img_data)
-            width, height = img.size
-            
-            if width < self.min_width or height < self.min_height:
-                return False, content_type, width, height, size_bytes
-            
-            return True, content_type, width, height, size_bytes
-            
+            # Throw out obvious non-candidates before opening a connection
+            if not _looks_like_image_url(img_url):
+                return None
+
+            async with await self._throttled_get(session, img_url) as response:
+                # Back off and retry once when the host says it is overloaded
+                if response.status == 429 and not _retried:
+                    retry_after = response.headers.get('Retry-After', '')
+                    try:
+                        wait = min(float(retry_after), 30.0)
+                    except ValueError:
+                        wait = self.delay
+                    await asyncio.sleep(wait)
+                    return await self._fetch_if_valid(session, img_url, _retried=True)
+
+                # Not modified since the last run: the saved copy stands
+                if response.status == 304:
+                    logger.debug("Skipping unchanged image %s (304)", img_url)
+                    return None
+
+                if response.status != 200:
+                    return None
+
+                # Reject non-images and undersized bodies from the headers
+                # alone, before reading anything off the socket — those
+                # rejections are content-based and settle the URL
+                content_type = response.headers.get('Content-Type', '')
+                if not content_type.startswith('image/'):
+                    self._settle_url(img_url, response.headers)
+                    return None
+
+                content_length = int(response.headers.get('Content-Length', 0) or 0)
+                if 0 < content_length < self.min_size_kb * 1024:
+                    self._settle_url(img_url, response.headers)
+                    return None
+
+                result = await self._read_and_validate(
+                    response.content.iter_chunked(4096), content_type
+                )
+
+                # Settle only after the stream finished: a mid-body reset
+                # or timeout raises above and leaves the URL retryable
+                self._settle_url(img_url, response.headers)
+                return result
+
         except Exception as e:
-            logger.debug(f"Error checking image {img_url}: {e}")
-            return False, "", 0, 0, 0
-    
-    def get_image_hash(self, img_data: bytes) -> str:
-        """Generate a hash for the image data to detect duplicates."""
-        return hashlib.md5(img_data).hexdigest()
-    
-    def download_image(self, img_url: str, max_retries=3) -> bool:
-        """Download an image with retry mechanism."""
-        for attempt in range(max_retries):
-            try:
-                # Get full URL
-                img_url = urljoin(self.base_url, img_url)
-                
-                # Check image info
-                is_valid, content_type, width, height, size_bytes = self.get_image_info(img_url)
-                
-                if not is_valid:
-                    logger.debug(f"Skipping image {img_url} (w:{width}, h:{height}, size:{size_bytes/1024:.1f}KB)")
-                    return False
-                
-                # Download the image
-                response = requests.get(img_url, headers=self.headers, timeout=10)
-                img_data = response.content
-                
-                # Check for duplicates using hash
-                img_hash = self.get_image_hash(img_data)
-                if img_hash in self.image_urls:
-                    logger.debug(f"Skipping duplicate image {img_url}")
-                    return False
-                
-                self.image_urls.add(img_hash)
-                
-                # Generate filename from URL
-                img_filename = os.path.basename(urlparse(img_url).path)
-                if not img_filename or "." not in img_filename:
-                    # Use hash as filename if URL doesn't have a valid filename
-                    extension = content_type.split('/')[-1]
-                    img_filename = f"{img_hash}.{extension}"
-                
-                # Save the image
-                img_path = os.path.join(self.image_dir, img_filename)
-                with open(img_path, 'wb') as f:
-                    f.write(img_data)
-                
-                logger.info(f"Downloaded {img_url} ({width}x{height}, {size_bytes/1024:.1f}KB) to {img_path}")
-                self.downloaded_count += 1
-                return True
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Attempt {attempt+1}/{max_retries} failed for {img_url}: {e}")
-                if attempt < max_retries - 1:
-                    # Exponential backoff
-                    wait_time = 2 ** attempt
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"Failed to download {img_url} after {max_retries} attempts")
-                    return False
-                
-            except Exception as e:
-                logger.error(f"Error downloading image {img_url}: {e}")
-                return False
-    
-    def extract_images_from_page(self, url: str) -> List[str]:
-        """Extract all image URLs from a page with expanded detection patterns."""
+            logger.debug("Error checking image %s: %s", img_url, e)
+            return None
+
+    async def _read_and_validate(self, chunks, content_type):
+        """
+        Streamed validation shared by the aiohttp and httpx fetch paths.
+        Incrementally decodes just enough of the chunk iterator to learn
+        the dimensions, so rejected images cost a few KB instead of the
+        full body; accepted images stream into one contiguous buffer
+        reused for the hash and the disk write.
+        """
+        from PIL import Image, ImageFile
+
+        parser = ImageFile.Parser()
+        data = bytearray()
+        width = height = None
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            data += chunk
+            if width is None:
+                # struct-level header sniff first; PIL's incremental
+                # parser only for formats it misses
+                dims = sniff_size(data)
+                if dims is None:
+                    parser.feed(chunk)
+                    if parser.image is not None:
+                        dims = parser.image.size
+                if dims is not None:
+                    width, height = dims
+                    # Dimensions known: bail before pulling the rest
+                    if width < self.min_width or height < self.min_height:
+                        return None
+            if len(data) > MAX_IMAGE_BYTES:
+                return None
+
+        if len(data) < self.min_size_kb * 1024:
+            return None
+
+        # Fall back to a header decode if incremental parsing never
+        # resolved the dimensions (some formats need the whole file)
+        if width is None:
+            width, height = Image.open(BytesIO(data)).size
+            if width < self.min_width or height < self.min_height:
+                return None
+
+        return data, content_type, width, height
+
+    async def _fetch_if_valid_h2(self, client, img_url: str, _retried: bool = False):
+        """
+        httpx/HTTP2 twin of _fetch_if_valid: same screens and streamed
+        validation, but requests multiplex over shared connections.
+        """
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
-                return []
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            img_urls = []
-            
-            # 1. Standard image tags
-            for img in soup.find_all('img'):
-                # Check regular src attribute
-                src = img.get('src')
-                if src:
+            if not _looks_like_image_url(img_url):
+                return None
+
+            host = urlparse(img_url).netloc
+            async with self._host_limiter(host):
+                async with client.stream(
+                    'GET', img_url, headers=self._conditional_headers(img_url)
+                ) as response:
+                    # Back off and retry once when the host says it is overloaded
+                    if response.status_code == 429 and not _retried:
+                        retry_after = response.headers.get('Retry-After', '')
+                        try:
+                            wait = min(float(retry_after), 30.0)
+                        except ValueError:
+                            wait = self.delay
+                        await asyncio.sleep(wait)
+                        return await self._fetch_if_valid_h2(client, img_url, _retried=True)
+
+                    # Not modified since the last run: the saved copy stands
+                    if response.status_code == 304:
+                        logger.debug("Skipping unchanged image %s (304)", img_url)
+                        return None
+
+                    if response.status_code != 200:
+                        return None
+
+                    # Header-level rejections are content-based and
+                    # settle the URL
+                    content_type = response.headers.get('Content-Type', '')
+                    if not content_type.startswith('image/'):
+                        self._settle_url(img_url, response.headers)
+                        return None
+
+                    content_length = int(response.headers.get('Content-Length', 0) or 0)
+                    if 0 < content_length < self.min_size_kb * 1024:
+                        self._settle_url(img_url, response.headers)
+                        return None
+
+                    result = await self._read_and_validate(
+                        response.aiter_bytes(4096), content_type
+                    )
+
+                    # Settle only after the stream finished: a mid-body
+                    # reset or timeout raises above and stays retryable
+                    self._settle_url(img_url, response.headers)
+                    return result
+
+        except Exception as e:
+            logger.debug("Error checking image %s: %s", img_url, e)
+            return None
+
+
+    def _parse_html(self, body) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        Parse a page body into (img_urls, anchors), preferring the
+        selectolax/lexbor parser when installed and falling back to
+        BeautifulSoup with lxml. Both paths apply the same collection
+        rules. Results are memoized against the body digest (bounded,
+        FIFO eviction) so byte-identical bodies - retried fetches,
+        pagination templates - parse once.
+        """
+        key = hashlib.sha1(body if isinstance(body, bytes) else bytes(body)).digest()
+        cached = self._parse_memo.get(key)
+        if cached is not None:
+            return cached
+
+        if _LexborParser is not None:
+            img_urls, anchors = self._parse_page_lexbor(_LexborParser(body))
+        else:
+            img_urls, anchors = self._parse_page(BeautifulSoup(body, 'lxml'))
+
+        # Tuples keep cached values safe from caller mutation
+        result = (tuple(img_urls), tuple(anchors))
+        if len(self._parse_memo) >= 256:
+            self._parse_memo.pop(next(iter(self._parse_memo)))
+        self._parse_memo[key] = result
+        return result
+
+    def _parse_page_lexbor(self, tree) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """selectolax twin of _parse_page; same filters, same outputs."""
+        img_urls = []
+        anchors = []
+
+        for node in tree.css('img'):
+            attrs = node.attributes
+
+            # Skip small images that are likely icons
+            width = attrs.get('width')
+            height = attrs.get('height')
+            if width and height:
+                try:
+                    if int(width) < 100 and int(height) < 100:
+                        continue
+                except ValueError:
+                    pass
+
+            src = attrs.get('src')
+            if src and not any(pattern in src.lower() for pattern in ICON_PATTERNS):
+                img_urls.append(src)
+
+            for attr, value in attrs.items():
+                if attr.startswith('data-') and ('src' in attr or 'image' in attr) and value:
+                    img_urls.append(value)
+
+            srcset = attrs.get('srcset')
+            if srcset:
+                for src_item in srcset.split(','):
+                    src_parts = src_item.strip().split(' ')
+                    if src_parts and src_parts[0]:
+                        img_urls.append(src_parts[0])
+
+        for node in tree.css('a[href]'):
+            href = node.attributes.get('href')
+            if href:
+                anchors.append((href, node.text().lower().strip()))
+                if _IMAGE_HREF_RE.search(href):
+                    img_urls.append(href)
+
+        for node in tree.css('style'):
+            text = node.text()
+            if text:
+                img_urls.extend(_BG_IMAGE_RE.findall(text))
+                img_urls.extend(_BG_SHORTHAND_RE.findall(text))
+
+        for node in tree.css('script'):
+            if node.attributes.get('type') in ('application/json', 'text/javascript'):
+                text = node.text()
+                if text:
+                    for match in _SCRIPT_IMG_URL_RE.finditer(text):
+                        img_urls.append(match.group(0))
+
+        for node in tree.css('[style]'):
+            style_attr = node.attributes.get('style')
+            if style_attr:
+                img_urls.extend(_BG_IMAGE_RE.findall(style_attr))
+                img_urls.extend(_BG_SHORTHAND_RE.findall(style_attr))
+
+        return img_urls, anchors
+
+    def _parse_page(self, soup) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        Single DOM traversal collecting everything the crawler needs from a
+        page: candidate image URLs (img tags with lazy-load/data attributes
+        and srcset entries, CSS backgrounds, script-embedded URLs, direct
+        image links) and all anchors as (href, link_text) pairs.
+        """
+        img_urls = []
+        anchors = []
+
+        for tag in soup.find_all(True):
+            name = tag.name
+
+            if name == 'img':
+                # Skip small images that are likely icons
+                width = tag.get('width')
+                height = tag.get('height')
+                if width and height:
+                    try:
+                        if int(width) < 100 and int(height) < 100:
+                            continue
+                    except ValueError:
+                        pass
+
+                # Check regular src attribute, filtering icon/decoration URLs
+                src = tag.get('src')
+                if src and not any(pattern in src.lower() for pattern in ICON_PATTERNS):
                     img_urls.append(src)
-                
+
                 # Check for ALL data attributes that might contain images
-                for attr in img.attrs:
-                    if attr.startswith('data-') and ('src' in attr or 'image' in attr):
-                        data_src = img.get(attr)
-                        if data_src:
-                            img_urls.append(data_src)
-                
+                for attr, value in tag.attrs.items():
+                    if attr.startswith('data-') and ('src' in attr or 'image' in attr) and value:
+                        img_urls.append(value)
+
                 # Check srcset attribute for responsive images
-                srcset = img.get('srcset')
+                srcset = tag.get('srcset')
                 if srcset:
                     # Extract URLs from srcset format: "url1 1x, url2 2x, ..."
                     for src_item in srcset.split(','):
                         src_parts = src_item.strip().split(' ')
                         if src_parts and src_parts[0]:
                             img_urls.append(src_parts[0])
-            
-            # 2. Background images in CSS (both inline and in style tags)
-            # Style tags
-            for style in soup.find_all('style'):
-                if style.string:
-                    # Extract URLs from background-image: url(...)
-                    urls = re.findall(r'background-image:\s*url\([\'"]?([^\'"()]+)[\'"]?\)', style.string)
-                    img_urls.extend(urls)
-                    
-                    # Also check for background: with url() function
-                    urls = re.findall(r'background:\s*[^;]*url\([\'"]?([^\'"()]+)[\'"]?\)', style.string)
-                    img_urls.extend(urls)
-            
-            # Inline styles
-            for element in soup.find_all(attrs={'style': True}):
-                style = element['style']
-                # Background-image property
-                urls = re.findall(r'background-image:\s*url\([\'"]?([^\'"()]+)[\'"]?\)', style)
-                img_urls.extend(urls)
-                
-                # Background property
-                urls = re.findall(r'background:\s*[^;]*url\([\'"]?([^\'"()]+)[\'"]?\)', style)
-                img_urls.extend(urls)
-            
-            # 3. Look for JSON data that might contain image URLs
-            scripts = soup.find_all('script', {'type': 'application/json'}) + soup.find_all('script', {'type': 'text/javascript'})
-            for script in scripts:
-                if script.string:
-                    # Look for patterns that might be image URLs in JSON data
-                    urls = re.findall(r'https?://[^"\']+\.(jpg|jpeg|png|gif|webp)', script.string)
-                    for match in urls:
-                        # Extract just the URL part (the full match without the extension group)
-                        full_url = re.search(r'(https?://[^"\']+\.{})'.format(match), script.string)
-                        if full_url:
-                            img_urls.append(full_url.group(1))
-            
-            # 4. Look for common gallery structures
-            gallery_containers = soup.find_all('div', class_=lambda c: c and any(term in c.lower() for term in ['gallery', 'slider', 'carousel']))
-            for container in gallery_containers:
-                # Check all a tags that might link to larger images
-                for a in container.find_all('a', href=True):
-                    href = a['href']
-                    if re.search(r'\.(jpg|jpeg|png|gif|webp)$', href, re.IGNORECASE):
+
+            elif name == 'a':
+                href = tag.get('href')
+                if href:
+                    anchors.append((href, tag.text.lower().strip()))
+                    # Anchors that link straight to an image file (galleries)
+                    if _IMAGE_HREF_RE.search(href):
                         img_urls.append(href)
-            
+
+            elif name == 'style':
+                if tag.string:
+                    img_urls.extend(_BG_IMAGE_RE.findall(tag.string))
+                    img_urls.extend(_BG_SHORTHAND_RE.findall(tag.string))
+
+            elif name == 'script':
+                # Look for image URLs embedded in JSON/JS data
+                if tag.string and tag.get('type') in ('application/json', 'text/javascript'):
+                    for match in _SCRIPT_IMG_URL_RE.finditer(tag.string):
+                        img_urls.append(match.group(0))
+
+            # Inline background images on any element
+            style_attr = tag.attrs.get('style')
+            if style_attr:
+                img_urls.extend(_BG_IMAGE_RE.findall(style_attr))
+                img_urls.extend(_BG_SHORTHAND_RE.findall(style_attr))
+
+        return img_urls, anchors
+
+    def extract_images_from_page(self, url: str) -> List[str]:
+        """Extract all image URLs from a page with expanded detection patterns."""
+        try:
+            response = self.session.get(url, timeout=15)
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
+                return []
+
+            img_urls, _ = self._parse_html(response.content)
             return img_urls
         except Exception as e:
             logger.error(f"Error extracting images from {url}: {e}")
             return []
-    
+
     def extract_links_from_page(self, url: str) -> List[str]:
         """Extract all links from a page."""
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, timeout=15)
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
                 return []
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
+
+            _, anchors = self._parse_html(response.content)
+
             links = []
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag['href']
+            for href, _text in anchors:
                 full_url = urljoin(url, href)
-                
                 if self.is_valid_url(full_url):
                     links.append(full_url)
-            
+
             return links
-            
+
         except Exception as e:
             logger.error(f"Error extracting links from {url}: {e}")
             return []
     
     def crawl(self):
-        """Start crawling from the base URL."""
+        """Synchronous entry point; drives the async crawl to completion."""
+        return asyncio.run(self.crawl_async())
+
+    def close(self):
+        """Release the pooled HTTP connections held by the session."""
+        self.session.close()
+
+    async def crawl_async(self):
+        """Crawl from the base URL, fetching independent pages concurrently."""
         self.visited_urls = set()
         self.image_urls = set()
         self.downloaded_count = 0
-        
-        # First, identify priority pages
-        self._identify_priority_pages(self.base_url)
-        
-        # Process the landing page first
-        self._process_url(self.base_url, is_priority=True)
-        
-        # Then process priority pages
-        for url in self.priority_pages:
-            if url not in self.visited_urls and len(self.visited_urls) < self.max_pages:
-                self._process_url(url, is_priority=True)
-        
+
+        # Per-host token buckets plus rolling latency samples; politeness
+        # is tuned per host rather than applied as a blanket delay
+        self._limiters = {}
+        self._host_latency = defaultdict(lambda: deque(maxlen=50))
+
+        # One pooled connection per host set, shared by page fetches and
+        # image downloads; the connector caps per-host sockets and caches
+        # DNS lookups for the duration of the crawl
+        connector = aiohttp.TCPConnector(
+            limit=self.connections,
+            limit_per_host=self.connections,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        timeout = aiohttp.ClientTimeout(total=15, connect=5)
+
+        # Pixel decoding and perceptual hashing are CPU-bound; a process
+        # pool keeps them off the event loop and spreads them across cores
+        self._cpu_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
+        async with aiohttp.ClientSession(
+            connector=connector, headers=self.headers, timeout=timeout, trust_env=True
+        ) as session:
+            # First, identify priority pages
+            await self._identify_priority_pages(session, self.base_url)
+
+            # Bloom filter of everything ever enqueued keeps frontier dedup at
+            # O(1) bit-probes and ~30 bytes/URL instead of a second string set
+            from pybloom_live import ScalableBloomFilter
+
+            enqueued = ScalableBloomFilter(initial_capacity=10000, error_rate=1e-4)
+
+            # BFS frontier: the landing page first, then the priority pages
+            frontier = deque([(self.base_url, True)])
+            enqueued.add(self.base_url)
+            for url in self.priority_pages:
+                if url not in enqueued:
+                    enqueued.add(url)
+                    frontier.append((url, True))
+
+            while frontier:
+                # Claim a batch of unvisited URLs, respecting max_pages
+                batch = []
+                while frontier and len(batch) < self.concurrency:
+                    url, is_priority = frontier.popleft()
+                    if url in self.visited_urls or len(self.visited_urls) >= self.max_pages:
+                        continue
+                    self.visited_urls.add(url)
+                    batch.append((url, is_priority))
+
+                if not batch:
+                    break
+
+                # Fetch the batch concurrently; pages are independent
+                results = await asyncio.gather(
+                    *(self._process_url(session, url, is_priority)
+                      for url, is_priority in batch),
+                    return_exceptions=True
+                )
+                for (url, _), result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error processing {url}: {result}")
+                        continue
+                    for link in result:
+                        if link not in enqueued:
+                            enqueued.add(link)
+                            frontier.append((link, True))
+
+            # Download everything found during the crawl
+            await self._download_images(session)
+
+        self._cpu_pool.shutdown()
+        self._save_seen()
+        self._save_etags()
         return self.downloaded_count
-    
-    def _identify_priority_pages(self, url):
+
+    def _host_limiter(self, host: str) -> AsyncLimiter:
+        """Token bucket for a single host, created lazily on first use."""
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = AsyncLimiter(PER_HOST_CONCURRENCY, 1)
+            self._limiters[host] = limiter
+        return limiter
+
+    def _host_delay(self, host: str) -> float:
+        """
+        AutoThrottle-style delay for one host: scale politeness to that
+        host's observed latency, so a fast CDN is not throttled as hard
+        as a struggling origin server. self.delay is the ceiling.
+        """
+        samples = self._host_latency[host]
+        if not samples:
+            return 0.0
+        return min(self.delay, (sum(samples) / len(samples)) / self.concurrency)
+
+    async def _throttled_get(self, session, url):
+        """
+        session.get gated by the URL's per-host token bucket and adaptive
+        delay, with the response latency fed back into the host's samples.
+        Callers get the raw response and remain responsible for releasing it.
+        """
+        host = urlparse(url).netloc
+        async with self._host_limiter(host):
+            delay = self._host_delay(host)
+            if delay:
+                await asyncio.sleep(delay)
+            started = time.monotonic()
+            response = await session.get(url, headers=self._conditional_headers(url))
+            self._host_latency[host].append(time.monotonic() - started)
+            return response
+
+    async def _identify_priority_pages(self, session, url):
         """Identify priority pages like rooms, suites, facilities, etc."""
         try:
             # Fetch the page
             logger.info(f"Scanning for priority pages at {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for links that might be relevant for a hotel website
-            priority_keywords = [
-                'room', 'suite', 'accommodation', 'stay', 'lodging',
-                'facility', 'amenity', 'service', 'spa', 'restaurant',
-                'dining', 'gallery', 'photo', 'image', 'tour',
-                'about', 'location', 'contact'
-            ]
-            
-            # Find all links
-            for link in soup.find_all('a'):
-                href = link.get('href')
-                if not href:
-                    continue
-                
-                # Get the link text
-                link_text = link.text.lower().strip()
-                
+            async with await self._throttled_get(session, url) as response:
+                response.raise_for_status()
+                body = await response.read()
+
+            # Find all links that might be relevant for a hotel website
+            _, anchors = self._parse_html(body)
+            for href, link_text in anchors:
                 # Check if the link or its text contains priority keywords
-                is_priority = any(keyword in link_text or keyword in href.lower() for keyword in priority_keywords)
+                is_priority = _has_keyword(_LANDING_MATCHER, link_text) or \
+                              _has_keyword(_LANDING_MATCHER, href.lower())
                 
                 if is_priority:
                     absolute_url = urljoin(url, href)
                     
                     # Only follow links to the same domain
                     if urlparse(absolute_url).netloc == self.domain:
-                        logger.info(f"Found priority page: {absolute_url}")
+                        logger.info("Found priority page: %s", absolute_url)
                         self.priority_pages.append(absolute_url)
         
         except Exception as e:
             logger.error(f"Error identifying priority pages at {url}: {e}")
     
-    def _process_url(self, url, is_priority=False):
-        """Process a URL to find images and links."""
-        # Check if we've reached the maximum number of pages
-        if len(self.visited_urls) >= self.max_pages:
-            return
-        
-        # Skip if already visited
-        if url in self.visited_urls:
-            return
-        
-        # Mark as visited
-        self.visited_urls.add(url)
-        
+    async def _process_url(self, session, url, is_priority=False):
+        """Process a single URL to find images, returning new priority links."""
+        new_links = []
+
         try:
             # Fetch the page
-            logger.info(f"Fetching {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find all images
-            for img in soup.find_all('img'):
-                img_url = img.get('src')
-                if not img_url:
-                    continue
-                
-                # Check if this is likely a content image (not an icon or decoration)
-                width = img.get('width')
-                height = img.get('height')
-                
-                # Skip small images that are likely icons
-                if width and height and int(width) < 100 and int(height) < 100:
-                    continue
-                
-                # Check for common icon/decoration patterns in the URL
-                if any(pattern in img_url.lower() for pattern in ['icon', 'logo', 'button', 'bg-', 'background']):
-                    continue
-                
-                # Add the image URL
-                absolute_url = urljoin(url, img_url)
-                self.image_urls.add(absolute_url)
-                
-                # Also check for data-src attribute (lazy loading)
-                data_src = img.get('data-src')
-                if data_src:
-                    absolute_data_src = urljoin(url, data_src)
-                    self.image_urls.add(absolute_data_src)
-            
-            # Look for background images in style attributes
-            for element in soup.find_all(lambda tag: tag.has_attr('style')):
-                style = element['style']
-                if 'background-image' in style:
-                    # Extract URL from background-image: url(...)
-                    match = re.search(r'background-image:\s*url\([\'"]?([^\'"]+)[\'"]?\)', style)
-                    if match:
-                        bg_url = match.group(1)
-                        absolute_bg_url = urljoin(url, bg_url)
-                        self.image_urls.add(absolute_bg_url)
-            
+            logger.info("Fetching %s", url)
+            async with await self._throttled_get(session, url) as response:
+                response.raise_for_status()
+                body = await response.read()
+
+            # Parse HTML and collect images + anchors in one traversal
+            img_urls, anchors = self._parse_html(body)
+
+            for img_url in img_urls:
+                self.image_urls.add(urljoin(url, img_url))
+
             # If this is a priority page, also look for links to other priority pages
             if is_priority:
-                # Find all links to follow
-                for link in soup.find_all('a'):
-                    href = link.get('href')
-                    if not href:
-                        continue
-                    
-                    # Get the link text
-                    link_text = link.text.lower().strip()
-                    
+                for href, link_text in anchors:
                     # Check if the link or its text contains priority keywords
-                    priority_keywords = [
-                        'room', 'suite', 'accommodation', 'stay', 'lodging',
-                        'facility', 'amenity', 'service', 'spa', 'restaurant',
-                        'dining', 'gallery', 'photo', 'image', 'tour'
-                    ]
-                    
-                    is_priority_link = any(keyword in link_text or keyword in href.lower() for keyword in priority_keywords)
-                    
+                    is_priority_link = _has_keyword(_PRIORITY_MATCHER, link_text) or \
+                                       _has_keyword(_PRIORITY_MATCHER, href.lower())
+
                     if is_priority_link:
                         absolute_url = urljoin(url, href)
-                        
-                        # Only follow links to the same domain
+
+                        # Only follow links to the same domain; the frontier
+                        # in crawl() handles visited checks and scheduling
                         if urlparse(absolute_url).netloc == self.domain and absolute_url not in self.visited_urls:
-                            # Add a delay to be nice to the server
-                            time.sleep(self.delay)
-                            self._process_url(absolute_url, is_priority=True)
-        
+                            new_links.append(absolute_url)
+
         except Exception as e:
             logger.error(f"Error processing {url}: {e}")
-        
-        # Download all found images
-        self._download_images()
+
+        return new_links
     
-    def _download_images(self):
-        """Download all images in the image_urls set."""
-        # Use a thread pool to download images concurrently
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit download tasks
-            future_to_url = {executor.submit(self._download_image, url): url for url in self.image_urls}
-            
-            # Process completed tasks
-            for future in concurrent.futures.as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.error(f"Error downloading {url}: {e}")
-        
-        # Clear the set of image URLs
+    async def _download_images(self, session):
+        """
+        Download every queued image through a staged batch pipeline:
+        fetch all bodies, hash all bodies, deduplicate all hashes, then
+        write the survivors. Each stage works over a homogeneous batch
+        instead of interleaving I/O and CPU per image, so the network,
+        the process pool, and the disk each run at full tilt in turn.
+        """
+        urls = list(self.image_urls)
         self.image_urls = set()
-    
-    def _download_image(self, url):
-        """Download and save an image if it meets the criteria."""
-        try:
-            # Fetch the image
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            # Check content type
-            content_type = response.headers.get('Content-Type', '')
-            if not content_type.startswith('image/'):
-                return
-            
-            # Check file size
-            file_size_kb = len(response.content) / 1024
-            if file_size_kb < self.min_size_kb:
-                return
-            
-            # Open the image to check dimensions
-            img = Image.open(BytesIO(response.content))
-            width, height = img.size
-            
-            # Check dimensions
-            if width < self.min_width or height < self.min_height:
-                return
-            
+
+        fetched = await self._fetch_batch(session, urls)
+        if not fetched:
+            return
+
+        hashed = await self._hash_batch(fetched)
+        if not hashed:
+            return
+
+        keep = self._dedup_batch(np.array([item[4] for item in hashed], dtype=np.uint64))
+        self._write_batch([item for item, ok in zip(hashed, keep) if ok])
+
+    async def _fetch_batch(self, session, urls):
+        """Stage 1: fetch and validate candidate bodies concurrently."""
+        # Task gate is sized independently of the socket pool: with more
+        # tasks than connections the pool stays saturated while finished
+        # transfers hand sockets straight to waiting tasks
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded_fetch(url):
+            async with semaphore:
+                return await self._fetch_if_valid(session, url)
+
+        # Skip URLs fetched in earlier runs (and batch-local repeats)
+        # before spending a GET; URLs only enter the seen set after a
+        # definitive server response, so failures stay retryable
+        pending = []
+        batch_norms = set()
+        for url in urls:
+            norm = _normalize_image_url(url)
+            if norm in batch_norms:
+                continue
+            # Seen URLs with stored validators are re-issued as
+            # conditional GETs: unchanged images come back as zero-byte
+            # 304s, changed ones are re-fetched
+            if norm in self._seen_urls and url not in self._etags:
+                continue
+            batch_norms.add(norm)
+            pending.append(url)
+        urls = pending
+
+        if httpx is not None:
+            # HTTP/2 path: dozens of image GETs share a handful of TLS
+            # connections instead of one socket each
+            async def bounded_fetch_h2(client, url):
+                async with semaphore:
+                    return await self._fetch_if_valid_h2(client, url)
+
+            limits = httpx.Limits(
+                max_connections=self.connections,
+                max_keepalive_connections=self.connections
+            )
+            async with httpx.AsyncClient(
+                http2=True, limits=limits, timeout=30.0,
+                headers=self.headers, follow_redirects=True
+            ) as client:
+                results = await asyncio.gather(
+                    *(bounded_fetch_h2(client, url) for url in urls),
+                    return_exceptions=True
+                )
+        else:
+            results = await asyncio.gather(
+                *(bounded_fetch(url) for url in urls),
+                return_exceptions=True
+            )
+        fetched = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error downloading {url}: {result}")
+            elif result is not None:
+                data, content_type, width, height = result
+                fetched.append((url, bytes(data), width, height))
+        return fetched
+
+    async def _hash_batch(self, fetched):
+        """Stage 2: decode and perceptually hash each body in the process pool."""
+        loop = asyncio.get_running_loop()
+        hashes = await asyncio.gather(
+            *(loop.run_in_executor(self._cpu_pool, _decode_and_hash, data)
+              for _, data, _, _ in fetched),
+            return_exceptions=True
+        )
+        hashed = []
+        for (url, data, width, height), phash in zip(fetched, hashes):
+            if isinstance(phash, Exception):
+                logger.debug("Could not hash %s: %s", url, phash)
+            else:
+                hashed.append((url, data, width, height, np.uint64(phash)))
+        return hashed
+
+    def _dedup_batch(self, phashes) -> List[bool]:
+        """
+        Stage 3: duplicate pass over the whole batch of hashes. Each hash
+        is compared against everything stored so far with the vectorized
+        XOR+popcount scan; survivors are registered as they pass.
+        """
+        keep = []
+        with self._phash_lock:
+            for phash in phashes:
+                if self._phashes.size:
+                    xor = self._phashes ^ phash
+                    dists = np.unpackbits(xor.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+                    if int(dists.min()) <= PHASH_MAX_DISTANCE:
+                        keep.append(False)
+                        continue
+                self._phashes = np.append(self._phashes, phash)
+                keep.append(True)
+        return keep
+
+    def _write_batch(self, survivors):
+        """Stage 4: bulk write the surviving bodies to disk."""
+        for url, data, width, height, _ in survivors:
+            # Identical bytes under a different URL: nothing new to save
+            digest = hashlib.sha256(data).hexdigest()
+            if digest in self._seen_digests:
+                logger.debug("Skipping byte-identical image %s", url)
+                continue
+            self._seen_digests.add(digest)
+
             # Generate a filename based on the URL
             filename = os.path.basename(urlparse(url).path)
             if not filename or '.' not in filename:
                 # Use a hash of the URL if the filename is invalid
                 filename = f"image_{hash(url) % 10000}.jpg"
-            
-            # Save the image
+
             file_path = os.path.join(self.image_dir, filename)
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            
-            logger.info(f"Downloaded {url} to {file_path} ({width}x{height}, {file_size_kb:.1f}KB)")
+            _write_image_bytes(file_path, data)
+
+            logger.info("Downloaded %s to %s (%dx%d, %.1fKB)", url, file_path, width, height, len(data) / 1024)
             self.downloaded_count += 1
-            
-        except Exception as e:
-            logger.error(f"Error downloading {url}: {e}")
 
     def extract_images_with_browser(self, url):
-        """Extract images using a headless browser to render JavaScript."""
+        """Extract image URLs by intercepting network traffic in a headless browser."""
         try:
             # This requires selenium to be installed: pip install selenium webdriver-manager
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
             from selenium.webdriver.chrome.service import Service
             from webdriver_manager.chrome import ChromeDriverManager
-            
+
             logger.info(f"Using headless browser to extract images from {url}")
-            
+
             # Set up headless browser
             chrome_options = Options()
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
-            
+            # Surface CDP network events through the performance log
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
             driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+
+            # Subscribe to network events before navigating, so the browser
+            # itself reports every image response - including ones loaded by
+            # XHR/fetch after render - with no DOM scraping or guessed waits
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Page.enable', {})
             driver.get(url)
-            
-            # Wait for JavaScript to load
-            time.sleep(5)
-            
-            # Extract images from rendered page
-            img_elements = driver.find_elements("tag name", "img")
+
             img_urls = []
-            
-            for img in img_elements:
-                src = img.get_attribute("src")
-                if src:
-                    img_urls.append(src)
-                
-                # Also check data attributes
-                for attr in ['data-src', 'data-original', 'data-lazy-src', 'data-url']:
-                    data_src = img.get_attribute(attr)
-                    if data_src:
-                        img_urls.append(data_src)
-            
-            # Get background images
-            script = """
-            return Array.from(document.querySelectorAll('*')).
-            filter(e => window.getComputedStyle(e).backgroundImage.includes('url')).
-            map(e => window.getComputedStyle(e).backgroundImage.replace(/url\\(['"](.+?)['"]/g, '$1'));
-            """
-            bg_images = driver.execute_script(script)
-            img_urls.extend(bg_images)
-            
+            seen = set()
+            quiet_polls = 0
+            total_polls = 0
+
+            # Poll the event log until the page stops producing new image
+            # responses instead of sleeping a fixed amount. Hard cap on
+            # total polls: carousels, webcams and ad slots emit image
+            # responses forever and would otherwise never go quiet
+            while quiet_polls < 3 and total_polls < 30:
+                time.sleep(1)
+                total_polls += 1
+                new_urls = 0
+                for entry in driver.get_log('performance'):
+                    try:
+                        message = json.loads(entry['message'])['message']
+                    except (KeyError, ValueError):
+                        continue
+                    if message.get('method') != 'Network.responseReceived':
+                        continue
+                    response = message.get('params', {}).get('response', {})
+                    img_url = response.get('url')
+                    if response.get('mimeType', '').startswith('image/') and img_url and img_url not in seen:
+                        seen.add(img_url)
+                        img_urls.append(img_url)
+                        new_urls += 1
+                quiet_polls = 0 if new_urls else quiet_polls + 1
+
             driver.quit()
-            logger.info(f"Found {len(img_urls)} images using headless browser")
+            logger.info(f"Found {len(img_urls)} images via network interception")
             return img_urls
-            
+
         except Exception as e:
             logger.error(f"Error extracting images with browser from {url}: {e}")
             return []
 
+# On-disk memo for extract_url_from_structured_json, keyed by
+# (path, mtime_ns, size) so edits to the JSON invalidate the entry
+_EXTRACT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "hotelharvest", "json_extract.pkl"
+)
+
+
+def _load_extract_cache() -> dict:
+    try:
+        with open(_EXTRACT_CACHE_PATH, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return {}
+
+
+def _store_extract_cache(cache: dict):
+    try:
+        os.makedirs(os.path.dirname(_EXTRACT_CACHE_PATH), exist_ok=True)
+        with open(_EXTRACT_CACHE_PATH, 'wb') as f:
+            pickle.dump(cache, f)
+    except Exception as e:
+        logger.debug(f"Could not persist extract cache: {e}")
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_url_cached(path: str, mtime_ns: int, size: int):
+    key = (path, mtime_ns, size)
+    cache = _load_extract_cache()
+    if key in cache:
+        return cache[key]
+    result = _extract_url_uncached(path)
+    cache[key] = result
+    _store_extract_cache(cache)
+    return result
+
+
 def extract_url_from_structured_json(json_file_path: str) -> str:
+    """
+    Extract website URL and ID from a structured JSON file. Results are
+    memoized in-process and on disk against the file's mtime and size,
+    so batch runs over unchanged configs skip the JSON parse entirely.
+    """
+    try:
+        stat = os.stat(json_file_path)
+    except OSError:
+        return _extract_url_uncached(json_file_path)
+    return _extract_url_cached(os.path.abspath(json_file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _extract_url_uncached(json_file_path: str) -> str:
     """Extract website URL and ID from a structured JSON file."""
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_file_path, 'rb') as f:
+            data = _json_loads(f.read())
         
         # Extract the unique ID from the structured JSON
         unique_id = data.get('id')
@@ -695,6 +1358,65 @@ def download_images_from_url(url, min_width, min_height, min_size, delay, max_pa
         logger.error(f"Error running image downloader: {e}")
         return False
 
+def run_one(url, unique_id, args):
+    """
+    Crawl a single site with the given CLI settings. Module-level so
+    --batch workers can pickle it into a process pool; each worker owns
+    its session, DNS cache, and event loop.
+    """
+    downloader = ImageDownloader(
+        base_url=_ensure_scheme(url),
+        unique_id=unique_id,
+        min_width=args.min_width,
+        min_height=args.min_height,
+        min_size_kb=args.min_size,
+        delay=args.delay,
+        max_pages=args.max_pages,
+        concurrency=args.concurrency,
+        connections=args.connections
+    )
+    try:
+        return asyncio.run(downloader.crawl_async())
+    except Exception as e:
+        logger.error(f"Error crawling {url}: {e}")
+        return 0
+    finally:
+        downloader.close()
+
+
+def _run_batch(args):
+    """Run every {url, id} job in a JSONL batch file across CPU cores."""
+    jobs = []
+    try:
+        with open(args.batch_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                job = _json_loads(line)
+                if job.get('url'):
+                    jobs.append((job['url'], job.get('id')))
+    except Exception as e:
+        logger.error(f"Error reading batch file {args.batch_file}: {e}")
+        return
+
+    if not jobs:
+        logger.error("No jobs found in batch file. Exiting.")
+        return
+
+    logger.info(f"Processing {len(jobs)} sites from {args.batch_file}")
+    start_time = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as pool:
+        counts = list(pool.map(
+            run_one,
+            [url for url, _ in jobs],
+            [unique_id for _, unique_id in jobs],
+            itertools.repeat(args)
+        ))
+    elapsed_time = time.perf_counter() - start_time
+    logger.info(f"Batch complete! Downloaded {sum(counts)} images from {len(jobs)} sites in {elapsed_time:.1f} seconds")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Download images from a website and its subpages")
     parser.add_argument("--url", "-u", help="URL of the website to crawl")
@@ -704,34 +1426,55 @@ def main():
     parser.add_argument("--min-size", type=int, default=50, help="Minimum image size in KB")
     parser.add_argument("--delay", "-d", type=float, default=1.0, help="Delay between requests in seconds")
     parser.add_argument("--max-pages", "-m", type=int, default=20, help="Maximum number of pages to crawl")
+    parser.add_argument("--concurrency", "-c", type=int, default=CRAWL_WORKERS, help="Concurrent fetch tasks (pages and images); for multi-host sites set above --connections")
+    parser.add_argument("--connections", type=int, default=32, help="Size of the underlying socket pool")
     parser.add_argument("--json-file", help="Path to structured JSON file to extract URL and ID from")
+    parser.add_argument("--batch-file", help="Path to a JSONL file of {url, id} jobs to crawl in parallel")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count(), help="Worker processes for --batch-file mode")
     
     args = parser.parse_args()
-    
+
+    # libuv event loop: noticeably higher aiohttp throughput where
+    # available (not on Windows); the default loop is fine otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Batch mode: fan the jobs out across worker processes and exit
+    if args.batch_file:
+        _run_batch(args)
+        return
+
     unique_id = args.id
     url = args.url
+
+    # Fast path for scripted invocations: both identifiers supplied on
+    # the command line, so skip JSON probing and the input() prompt
+    if not (url and unique_id):
+        # If JSON file is provided, extract URL and ID from it
+        if args.json_file:
+            extracted_url, extracted_id = extract_url_from_structured_json(args.json_file)
+            if not url and extracted_url:
+                url = extracted_url
+                logger.info(f"Using URL from JSON file: {url}")
+            if not unique_id:
+                unique_id = extracted_id
+                logger.info(f"Using ID from JSON file: {unique_id}")
+
+        # Get URL from command line or prompt if still not available
+        if not url:
+            url = input("Enter the URL to download images from: ").strip()
+
+        if not url:
+            logger.error("No URL provided. Exiting.")
+            return
     
-    # If JSON file is provided, extract URL and ID from it
-    if args.json_file:
-        extracted_url, extracted_id = extract_url_from_structured_json(args.json_file)
-        if not url and extracted_url:
-            url = extracted_url
-            logger.info(f"Using URL from JSON file: {url}")
-        if not unique_id:
-            unique_id = extracted_id
-            logger.info(f"Using ID from JSON file: {unique_id}")
-    
-    # Get URL from command line or prompt if still not available
-    if not url:
-        url = input("Enter the URL to download images from: ").strip()
-    
-    if not url:
-        logger.error("No URL provided. Exiting.")
-        return
-    
-    # Add http:// if missing
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
+    # Add https:// if missing
+    normalized = _ensure_scheme(url)
+    if normalized is not url:
+        url = normalized
         logger.info(f"Added https:// to URL: {url}")
     
     downloader = ImageDownloader(
@@ -741,16 +1484,22 @@ def main():
         min_height=args.min_height,
         min_size_kb=args.min_size,
         delay=args.delay,
-        max_pages=args.max_pages
+        max_pages=args.max_pages,
+        concurrency=args.concurrency,
+        connections=args.connections
     )
     
     logger.info(f"Starting image download from {url}")
     logger.info(f"Minimum dimensions: {args.min_width}x{args.min_height} pixels")
     logger.info(f"Minimum size: {args.min_size} KB")
     
-    start_time = time.time()
-    image_count = downloader.crawl()
-    elapsed_time = time.time() - start_time
+    # Monotonic timing: immune to NTP adjustments, unlike time.time()
+    start_time = time.perf_counter()
+    try:
+        image_count = asyncio.run(downloader.crawl_async())
+    finally:
+        downloader.close()
+    elapsed_time = time.perf_counter() - start_time
     
     logger.info(f"Download complete! Downloaded {image_count} images in {elapsed_time:.1f} seconds")
     logger.info(f"Images saved to {downloader.image_dir}")
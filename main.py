@@ -1,8 +1,21 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 import os
+import mmap
+import tempfile
 import time
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
+from functools import lru_cache
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from typing import Set, Dict, List, Tuple, Optional
 from markdownify import markdownify
@@ -10,6 +23,31 @@ import json
 import sys
 import re
 import tldextract
+from pybloom_live import ScalableBloomFilter
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data):
+    """Decode JSON with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 # Configure logging
 logging.basicConfig(
@@ -22,20 +60,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger("WebsiteScraper")
 
+# HTML parser backend for BeautifulSoup (lxml is the fastest supported one)
+PARSER = "lxml"
+
+# Number of concurrent crawl workers (the crawl is I/O bound, politeness
+# is enforced per host rather than by a global serial delay)
+CRAWL_WORKERS = 50
+
+# File extensions the crawler never follows; tuple form so endswith does
+# one C-level scan
+FILE_EXTS = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg',
+             '.css', '.js', '.ico', '.xml', '.zip', '.doc', '.docx')
+
+# Query params that only change the booking UI (language, currency,
+# session), stripped during normalization
+_STRIP_PARAMS = frozenset({'lang', 'language', 'currency', 'nsid', 'sessionid'})
+
+# Language-style hrefs: a two-letter path segment or a lang= query param
+_LANG_RE = re.compile(r'/[a-z]{2}(?:/|$)|lang=[a-z]{2}')
+
+# Anchors inside navigation areas (tag, role, or nav-ish class/id names)
+_MENU_SELECTOR = (
+    'nav a[href], header a[href], [role="navigation"] a[href], '
+    '[class*="nav"] a[href], [class*="menu"] a[href], '
+    '[class*="header"] a[href], [class*="topbar"] a[href], '
+    '[id*="nav"] a[href], [id*="menu"] a[href], '
+    '[id*="header"] a[href], [id*="topbar"] a[href]'
+)
+
+
+@lru_cache(maxsize=50000)
+def _parse(url: str):
+    """urlparse, memoized — the same URL is parsed several times per crawl"""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=50000)
+def _tld(url: str):
+    """tldextract.extract, memoized — the PSL lookup is expensive"""
+    return tldextract.extract(url)
+
+
+@lru_cache(maxsize=50000)
+def _labels(netloc: str) -> frozenset:
+    """Dot-separated labels of a lowercased netloc, as a frozenset"""
+    return frozenset(netloc.lower().split('.'))
+
+
+@lru_cache(maxsize=50000)
+def _netloc_root(netloc: str) -> str:
+    """Registrable root domain of a netloc — one PSL walk per host, not
+    one per anchor"""
+    extracted = tldextract.extract(netloc)
+    return f"{extracted.domain}.{extracted.suffix}"
+
+
+@dataclass(slots=True)
+class UrlEntry:
+    """Frontier record carrying per-URL predicates computed exactly once"""
+    url: str
+    priority: int
+    is_booking: bool
+    netloc: str
+
 class WebsiteScraper:
     def __init__(self, base_url: str, delay: float = 1.0, max_booking_urls: int = 5):
         self.base_url = base_url
-        self.parsed_base_url = urlparse(base_url)
+        self.parsed_base_url = _parse(base_url)
         self.domain = self.parsed_base_url.netloc
         
         # Extract the root domain (e.g., chouchouhotel.com from www.chouchouhotel.com or en.chouchouhotel.com)
-        extracted = tldextract.extract(base_url)
+        extracted = _tld(base_url)
         self.root_domain = f"{extracted.domain}.{extracted.suffix}"
         logger.info(f"Root domain identified as: {self.root_domain}")
         
         self.delay = delay
         self.visited_urls: Set[str] = set()
-        self.markdown_content: Dict[str, str] = {}
+        # Bloom filter front-end over everything ever enqueued, so the
+        # "already queued?" check is a few bit probes instead of scans
+        self.enqueued = ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
+
+        # Pages are spooled to disk as JSONL while crawling so peak
+        # memory no longer scales with crawl size. Opened lazily at
+        # crawl start: scrapers discarded before crawling (failed
+        # validation, replaced after a redirect) leave no temp file
+        self._spool_path: Optional[str] = None
+        self._spool = None
+        self.pages_scraped = 0
         
         # Define priority paths to look for, including language-specific paths
         self.priority_paths = [
@@ -57,7 +168,8 @@ class WebsiteScraper:
         ]
         
         # Common language prefixes to check for language-specific subdomains
-        self.language_prefixes = ['en', 'fr', 'de', 'es', 'it', 'nl', 'pt', 'ru', 'zh', 'ja', 'ko']
+        self.language_prefixes = frozenset(
+            ['en', 'fr', 'de', 'es', 'it', 'nl', 'pt', 'ru', 'zh', 'ja', 'ko'])
         
         # Track main page links to prioritize direct subpages
         self.main_page_links: Set[str] = set()
@@ -67,6 +179,12 @@ class WebsiteScraper:
             'booking', 'reserve', 'reservation', 'book'
         ]
         
+        # Compile priority_paths into a single alternation regex so each
+        # check is one scan instead of 30+ substring tests; domain checks
+        # use O(1) label-set intersection instead
+        self._priority_re = re.compile('|'.join(re.escape(p) for p in self.priority_paths))
+        self._booking_terms = frozenset(self.potential_booking_domains)
+
         # Limit the number of booking URLs to crawl
         self.max_booking_urls = max_booking_urls
         self.booking_urls_crawled = 0
@@ -74,7 +192,50 @@ class WebsiteScraper:
         
         # Track language-specific subdomains we've found
         self.language_subdomains: Set[str] = set()
-        
+
+        # Per-host politeness state for the async crawl: a semaphore
+        # guarding the bookkeeping plus the monotonic instant at which
+        # each host may be hit again
+        self._host_limiters: Dict[str, AsyncLimiter] = {}
+
+        # Monotonic tiebreaker so equal-priority URLs pop in FIFO order
+        self._counter = 0
+
+        # Markdown conversion is pure-Python CPU work; run it off the
+        # event loop so it overlaps with in-flight fetches
+        self._md_pool = ThreadPoolExecutor(max_workers=4)
+
+        # One pooled session for the remaining synchronous requests, so
+        # repeated hits on the same host reuse the TCP+TLS connection
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Body of the validation GET, reused as the crawl's first fetch
+        self._prefetched_body: Optional[bytes] = None
+
+        # robots.txt rules for the base host, consulted before enqueueing
+        # so disallowed URLs never consume queue space or round-trips.
+        # Fetched through the pooled session rather than read() so the
+        # request carries a timeout like every other network call here
+        self.robots = RobotFileParser()
+        try:
+            response = self.session.get(urljoin(self.base_url, '/robots.txt'), timeout=10)
+            if response.status_code == 200:
+                self.robots.parse(response.text.splitlines())
+                self._robots_loaded = True
+            else:
+                self._robots_loaded = False
+        except Exception as e:
+            logger.warning(f"Could not read robots.txt for {self.domain}: {e}")
+            self._robots_loaded = False
+
     def validate_url(self) -> Tuple[bool, Optional[str]]:
         """
         Validate if the base URL exists and handle redirects.
@@ -85,20 +246,22 @@ class WebsiteScraper:
             - redirected_url: The URL after redirection, or None if no redirection
         """
         try:
-            # Set a timeout to avoid hanging on non-responsive sites
-            response = requests.head(
-                self.base_url, 
-                headers={'User-Agent': 'Mozilla/5.0'}, 
+            # Issue the crawl's first GET here instead of a separate HEAD
+            # probe — the body is kept and reused by the crawl, so
+            # validation costs no extra round-trip
+            response = self.session.get(
+                self.base_url,
                 timeout=10,
                 allow_redirects=True
             )
-            
+
             # Check if the URL exists (2xx status code)
             if 200 <= response.status_code < 300:
                 # Check if there was a redirect
-                if response.url != self.base_url:
+                if response.history and response.url != self.base_url:
                     logger.info(f"URL was redirected: {self.base_url} -> {response.url}")
                     return True, response.url
+                self._prefetched_body = response.content
                 return True, None
             
             # Handle common error status codes
@@ -128,20 +291,17 @@ class WebsiteScraper:
     
     def is_same_site(self, url: str) -> bool:
         """Check if URL belongs to the same website (including subdomains)"""
-        parsed = urlparse(url)
-        if not parsed.netloc:
+        netloc = _parse(url).netloc
+        if not netloc:
             return False
-            
-        # Extract domain parts
-        extracted = tldextract.extract(url)
-        url_root_domain = f"{extracted.domain}.{extracted.suffix}"
-        
-        # Check if it's the same root domain
-        return url_root_domain == self.root_domain
+
+        # Check if it's the same root domain; pages link to the same few
+        # hosts hundreds of times, so resolution is keyed by netloc
+        return _netloc_root(netloc) == self.root_domain
         
     def is_valid_url(self, url: str) -> bool:
         """Check if URL belongs to the same website (including subdomains) and is not a file/anchor"""
-        parsed = urlparse(url)
+        parsed = _parse(url)
         
         # Skip anchors, files, external links, mailto, tel, etc.
         if not parsed.netloc:
@@ -150,93 +310,142 @@ class WebsiteScraper:
         # Check if it's the same site (including subdomains)
         if not self.is_same_site(url):
             # Allow external booking domains that might contain room information
-            if any(booking_term in parsed.netloc.lower() for booking_term in self.potential_booking_domains) and \
+            if self._booking_terms & _labels(parsed.netloc) and \
                self.root_domain in parsed.netloc.lower():
                 logger.info(f"Found potential external booking URL: {url}")
                 return True
             return False
         
         # Skip common file extensions
-        file_extensions = ['.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', 
-                          '.css', '.js', '.ico', '.xml', '.zip', '.doc', '.docx']
-        if any(parsed.path.lower().endswith(ext) for ext in file_extensions):
+        if parsed.path.lower().endswith(FILE_EXTS):
             return False
             
         return True
     
     def normalize_url(self, url: str) -> str:
         """Normalize URL by removing fragments and trailing slashes"""
-        parsed = urlparse(url)
+        parsed = _parse(url)
         normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
         if parsed.query:
             # For booking URLs, strip out common parameters that just change the UI language or currency
             if self.is_booking_url(url):
-                query_params = {}
-                for param in parsed.query.split('&'):
-                    if '=' in param:
-                        key, value = param.split('=', 1)
-                        # Skip language, currency, and session ID parameters
-                        if key.lower() not in ['lang', 'language', 'currency', 'nsid', 'sessionid']:
-                            query_params[key] = value
-                if query_params:
-                    normalized += '?' + '&'.join(f"{k}={v}" for k, v in query_params.items())
+                params = parse_qsl(parsed.query, keep_blank_values=True)
+                filtered = [(k, v) for k, v in params if k.lower() not in _STRIP_PARAMS]
+                if filtered:
+                    normalized += '?' + urlencode(filtered)
             else:
                 normalized += f"?{parsed.query}"
         return normalized.rstrip('/')
     
     def is_priority_url(self, url: str) -> bool:
         """Check if URL contains priority paths we want to prioritize"""
-        parsed = urlparse(url)
+        parsed = _parse(url)
         path = parsed.path.lower()
         
         # Check if it's a language subdomain (e.g., en.chouchouhotel.com)
-        extracted = tldextract.extract(url)
+        extracted = _tld(url)
         if extracted.subdomain in self.language_prefixes:
             # Add this language subdomain to our tracked list
             self.language_subdomains.add(parsed.netloc)
             return True
             
         # Check if it's a booking URL (either internal or external)
-        if any(booking_term in parsed.netloc.lower() for booking_term in self.potential_booking_domains):
+        if self._booking_terms & _labels(parsed.netloc):
             return True
-            
+
         # Check if any priority path is in the URL path
-        return any(priority in path for priority in self.priority_paths) or url in self.main_page_links
+        return bool(self._priority_re.search(path)) or url in self.main_page_links
     
-    def extract_booking_links(self, soup, url: str) -> List[str]:
-        """Extract potential booking links from the page"""
-        booking_links = []
-        
-        # Look for links with booking-related text or classes
-        booking_indicators = ['book', 'reserve', 'booking', 'reservation', 'check availability']
-        
+    def _extract_anchors(self, body) -> Tuple[list, List[str]]:
+        """Parse the anchor structure of a page once.
+
+        Returns (anchors, menu_hrefs): anchors is a list of
+        (href, text, classes, img_src) tuples with text/classes/img_src
+        lowercased, menu_hrefs the raw hrefs found in navigation areas.
+        Uses the C-level Lexbor parser when selectolax is installed; the
+        full BeautifulSoup tree is only built for the markdownify path.
+        """
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(body)
+            anchors = []
+            for node in tree.css('a[href]'):
+                attrs = node.attributes
+                href = attrs.get('href') or ''
+                text = (node.text() or '').lower().strip()
+                classes = (attrs.get('class') or '').lower()
+                img = node.css_first('img')
+                img_src = (img.attributes.get('src') or '').lower() if img is not None else ''
+                anchors.append((href, text, classes, img_src))
+            menu_hrefs = []
+            seen = set()
+            for node in tree.css(_MENU_SELECTOR):
+                href = node.attributes.get('href') or ''
+                if href and href not in seen:
+                    seen.add(href)
+                    menu_hrefs.append(href)
+            return anchors, menu_hrefs
+
+        # BeautifulSoup fallback building the same records
+        soup = BeautifulSoup(body, PARSER)
+        anchors = []
         for a_tag in soup.find_all('a', href=True):
             href = a_tag['href']
             text = a_tag.get_text().lower().strip()
-            
+            classes = ' '.join(cls for cls in (a_tag.get('class') or []) if cls).lower()
+            img = a_tag.find('img')
+            img_src = (img.get('src') or '').lower() if img else ''
+            anchors.append((href, text, classes, img_src))
+
+        nav_elements = soup.find_all(
+            ['nav', 'header', 'div'],
+            class_=lambda c: c and any(term in c.lower() for term in ['nav', 'menu', 'header', 'topbar'])
+        )
+        if not nav_elements:
+            nav_elements = soup.find_all(attrs={"role": "navigation"})
+        if not nav_elements:
+            nav_elements = soup.find_all(id=lambda i: i and any(term in i.lower() for term in ['nav', 'menu', 'header', 'topbar']))
+
+        menu_hrefs = []
+        seen = set()
+        for nav in nav_elements:
+            for a_tag in nav.find_all('a', href=True):
+                href = a_tag['href']
+                if href and href not in seen:
+                    seen.add(href)
+                    menu_hrefs.append(href)
+        return anchors, menu_hrefs
+
+    def extract_booking_links(self, anchors, url: str) -> List[str]:
+        """Extract potential booking links from a page's anchor records"""
+        booking_links = []
+
+        # Look for links with booking-related text or classes
+        booking_indicators = ['book', 'reserve', 'booking', 'reservation', 'check availability']
+
+        for href, text, classes, _ in anchors:
             # Check if the link text contains booking indicators
             if any(indicator in text for indicator in booking_indicators) or \
                any(indicator in href.lower() for indicator in booking_indicators) or \
-               a_tag.get('class') and any(cls and 'book' in cls.lower() for cls in a_tag.get('class')):
-                
+               'book' in classes:
+
                 full_url = urljoin(url, href)
-                parsed = urlparse(full_url)
-                
+                parsed = _parse(full_url)
+
                 # Skip if it's a fragment or javascript
                 if not parsed.netloc and (not parsed.path or parsed.path == '#' or 'javascript:' in href):
                     continue
-                    
+
                 booking_links.append(full_url)
                 logger.info(f"Found booking link: {full_url}")
-        
+
         return booking_links
     
     def is_booking_url(self, url: str) -> bool:
         """Check if URL is likely a booking page"""
-        parsed = urlparse(url)
+        parsed = _parse(url)
         
         # Check domain
-        if any(term in parsed.netloc.lower() for term in self.potential_booking_domains):
+        if self._booking_terms & _labels(parsed.netloc):
             return True
             
         # Check path
@@ -249,242 +458,287 @@ class WebsiteScraper:
             
         return False
     
-    def extract_language_variants(self, soup, url: str) -> List[str]:
+    def extract_language_variants(self, anchors, url: str) -> List[str]:
         """Extract language-specific variants of the current page"""
         language_links = []
-        
+        language_names = ['english', 'français', 'deutsch', 'español', 'italiano', 'en', 'fr', 'de', 'es', 'it']
+
         # Look for language switcher links
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            
+        for href, text, classes, img_src in anchors:
             # Skip empty or javascript links
             if not href or href.startswith('#') or href.startswith('javascript:'):
                 continue
-                
-            # Check if it's a language link by looking at common patterns
-            is_language_link = False
-            
-            # Check for language codes in the URL
-            if re.search(r'/[a-z]{2}(/|$)', href) or re.search(r'lang=[a-z]{2}', href):
-                is_language_link = True
-                
-            # Check for language names in the link text
-            text = a_tag.get_text().lower().strip()
-            language_names = ['english', 'français', 'deutsch', 'español', 'italiano', 'en', 'fr', 'de', 'es', 'it']
-            if any(lang in text for lang in language_names):
-                is_language_link = True
-                
-            # Check for language flags in the images
-            img_tag = a_tag.find('img')
-            if img_tag and img_tag.get('src') and ('flag' in img_tag.get('src').lower() or 'lang' in img_tag.get('src').lower()):
-                is_language_link = True
-                
-            # Check for common language switcher classes
-            classes = a_tag.get('class', [])
-            if classes and any(cls and ('lang' in cls.lower() or 'language' in cls.lower()) for cls in classes):
-                is_language_link = True
-                
+
+            # Check if it's a language link by looking at common patterns:
+            # language codes in the URL, language names in the link text,
+            # flag images, or language switcher classes
+            is_language_link = (
+                bool(_LANG_RE.search(href))
+                or any(lang in text for lang in language_names)
+                or ('flag' in img_src or 'lang' in img_src)
+                or ('lang' in classes or 'language' in classes)
+            )
+
             if is_language_link:
                 full_url = urljoin(url, href)
-                
+
                 # Only include if it's on the same site
                 if self.is_same_site(full_url):
                     language_links.append(full_url)
                     logger.info(f"Found language variant: {full_url}")
-        
+
         return language_links
-    
-    def extract_header_menu_links(self, soup, url: str) -> List[str]:
+
+    def extract_header_menu_links(self, menu_hrefs, url: str) -> List[str]:
         """Extract links from the header/navigation menu"""
         menu_links = []
-        
-        # Look for navigation elements
-        nav_elements = soup.find_all(['nav', 'header', 'div'], class_=lambda c: c and any(term in c.lower() for term in ['nav', 'menu', 'header', 'topbar']))
-        
-        if not nav_elements:
-            # If no nav elements with those classes, try to find by role
-            nav_elements = soup.find_all(attrs={"role": "navigation"})
-            
-        if not nav_elements:
-            # If still no nav elements, look for common header IDs
-            nav_elements = soup.find_all(id=lambda i: i and any(term in i.lower() for term in ['nav', 'menu', 'header', 'topbar']))
-        
-        # Process all navigation elements found
-        for nav in nav_elements:
-            for a_tag in nav.find_all('a', href=True):
-                href = a_tag['href']
-                
-                # Skip empty or javascript links
-                if not href or href.startswith('#') or href.startswith('javascript:'):
-                    continue
-                    
-                full_url = urljoin(url, href)
-                
-                # Only include if it's on the same site
-                if self.is_same_site(full_url):
-                    menu_links.append(full_url)
-                    logger.info(f"Found menu link: {full_url}")
-        
+
+        for href in menu_hrefs:
+            # Skip empty or javascript links
+            if not href or href.startswith('#') or href.startswith('javascript:'):
+                continue
+
+            full_url = urljoin(url, href)
+
+            # Only include if it's on the same site
+            if self.is_same_site(full_url):
+                menu_links.append(full_url)
+                logger.info(f"Found menu link: {full_url}")
+
         return menu_links
     
-    def crawl(self) -> Dict[str, str]:
-        """Crawl the website and extract content"""
+    def crawl(self) -> Optional[str]:
+        """Crawl the website; returns the path to the JSONL page spool"""
+        return asyncio.run(self._crawl_async())
+
+    def _enqueue(self, queue: asyncio.Queue, url: str) -> bool:
+        """Enqueue a URL unless it was already queued or visited.
+
+        Priority is computed once here, on insertion, instead of
+        re-sorting the whole frontier on every pop.
+        """
+        if url in self.visited_urls or url in self.enqueued:
+            return False
+
+        # Respect robots.txt for URLs on the base host
+        if self._robots_loaded and _parse(url).netloc == self.domain \
+                and not self.robots.can_fetch('Mozilla/5.0', url):
+            logger.info(f"Skipping URL disallowed by robots.txt: {url}")
+            return False
+
+        self.enqueued.add(url)
+        entry = UrlEntry(
+            url=url,
+            priority=0 if self.is_priority_url(url) else 1,
+            is_booking=self.is_booking_url(url),
+            netloc=_parse(url).netloc
+        )
+        queue.put_nowait((entry.priority, self._counter, entry))
+        self._counter += 1
+        return True
+
+    def _host_limiter(self, netloc: str) -> AsyncLimiter:
+        """Get (or create) the politeness rate limiter for a host"""
+        limiter = self._host_limiters.get(netloc)
+        if limiter is None:
+            limiter = self._host_limiters[netloc] = AsyncLimiter(
+                max_rate=1, time_period=max(self.delay, 0.01)
+            )
+        return limiter
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        """Fetch a page politely, spacing requests per host by self.delay"""
+        netloc = _parse(url).netloc
+        # Token bucket: one request per delay window per host, with
+        # unrelated hosts never waiting on each other
+        await self._host_limiter(netloc).acquire()
+
+        response = await session.get(url)
+        async with response:
+            if response.status != 200:
+                logger.warning(f"Failed to fetch {url}: {response.status}")
+                return None
+
+            # Bail before reading the body on non-HTML responses
+            # (PDFs, images, feeds) — nothing downstream wants them
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type.lower():
+                logger.info(f"Skipping non-HTML content ({content_type}): {url}")
+                return None
+
+            return await response.read()
+
+    async def _crawl_async(self) -> Optional[str]:
+        """Crawl the website concurrently and spool page content to disk"""
+        self._spool_path = os.path.join(
+            tempfile.gettempdir(), f"scraper_spool_{os.getpid()}_{id(self):x}.jsonl")
+        self._spool = open(self._spool_path, 'wb')
+
+        # One session for the whole crawl: keep-alive and the DNS cache
+        # are shared by every page fetch, so each host pays for one TLS
+        # handshake and one resolver hit
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=2,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
         try:
-            # Start with the base URL
-            urls_to_visit = [self.base_url]
-            priority_urls = []
-            
-            # First, crawl the main page to extract important links
-            response = requests.get(self.base_url, headers={'User-Agent': 'Mozilla/5.0'})
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract all links from the main page
-                for a_tag in soup.find_all('a', href=True):
-                    href = a_tag['href']
-                    if href and not href.startswith('#') and not href.startswith('javascript:'):
-                        full_url = urljoin(self.base_url, href)
-                        if self.is_valid_url(full_url):
-                            normalized_url = self.normalize_url(full_url)
-                            self.main_page_links.add(normalized_url)
-                
-                # Extract language variants
-                language_links = self.extract_language_variants(soup, self.base_url)
-                for link in language_links:
-                    if self.is_valid_url(link):
-                        normalized_url = self.normalize_url(link)
-                        if normalized_url not in self.visited_urls:
-                            priority_urls.append(normalized_url)
-                            logger.info(f"Added language variant to priority queue: {normalized_url}")
-                
-                # Extract header/menu links
-                menu_links = self.extract_header_menu_links(soup, self.base_url)
-                for link in menu_links:
-                    if self.is_valid_url(link):
-                        normalized_url = self.normalize_url(link)
-                        if normalized_url not in self.visited_urls:
-                            priority_urls.append(normalized_url)
-                            logger.info(f"Added menu link to priority queue: {normalized_url}")
-                
-                # Extract booking links
-                booking_links = self.extract_booking_links(soup, self.base_url)
-                for link in booking_links:
-                    if self.is_valid_url(link):
-                        normalized_url = self.normalize_url(link)
-                        if normalized_url not in self.visited_urls:
-                            priority_urls.append(normalized_url)
-                            logger.info(f"Added booking link to priority queue: {normalized_url}")
-            
-            # Process the main page first
-            self._process_url(self.base_url)
-            
-            # Then process all priority URLs (language variants, menu links, etc.)
-            for url in priority_urls:
-                if url not in self.visited_urls:
-                    self._process_url(url)
-                    
-                    # After processing each priority URL, check for language subdomains
-                    parsed = urlparse(url)
-                    extracted = tldextract.extract(url)
-                    
-                    # If this is a language subdomain, explore it further
-                    if extracted.subdomain in self.language_prefixes:
-                        logger.info(f"Exploring language subdomain: {parsed.netloc}")
-                        
-                        # Get all links from this language subdomain
-                        try:
-                            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-                            if response.status_code == 200:
-                                soup = BeautifulSoup(response.text, 'html.parser')
-                                
-                                # Extract menu links from this language subdomain
-                                subdomain_menu_links = self.extract_header_menu_links(soup, url)
-                                for link in subdomain_menu_links:
-                                    if self.is_valid_url(link) and link not in self.visited_urls:
-                                        normalized_url = self.normalize_url(link)
-                                        urls_to_visit.append(normalized_url)
-                                        logger.info(f"Added language subdomain menu link: {normalized_url}")
-                        except Exception as e:
-                            logger.error(f"Error exploring language subdomain {url}: {e}")
-            
-            # Now process the remaining URLs
-            while urls_to_visit:
-                # Sort URLs to prioritize important ones
-                urls_to_visit.sort(key=lambda u: 0 if self.is_priority_url(u) else 1)
-                
-                # Get the next URL to process
-                url = urls_to_visit.pop(0)
-                
-                # Skip if already visited
-                if url in self.visited_urls:
-                    continue
-                
-                # Process the URL
-                new_urls = self._process_url(url)
-                
-                # Add new URLs to the queue
-                for new_url in new_urls:
-                    if new_url not in self.visited_urls and new_url not in urls_to_visit:
-                        urls_to_visit.append(new_url)
-            
-            logger.info(f"Crawling complete. Visited {len(self.visited_urls)} URLs.")
-            return self.markdown_content
-            
+            async with aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': 'Mozilla/5.0'},
+                timeout=aiohttp.ClientTimeout(total=30, connect=5),
+                trust_env=True
+            ) as session:
+                queue: asyncio.Queue = asyncio.PriorityQueue()
+                priority_urls = []
+
+                # First, crawl the main page to extract important links,
+                # reusing the validation GET's body when we have it
+                body = self._prefetched_body
+                self._prefetched_body = None
+                if body is None:
+                    try:
+                        body = await self._fetch(session, self.base_url)
+                    except Exception as e:
+                        logger.error(f"Error fetching main page {self.base_url}: {e}")
+                        body = None
+
+                if body:
+                    # Walk the anchor structure once and share it with
+                    # every extractor instead of re-traversing the tree
+                    anchors, menu_hrefs = self._extract_anchors(body)
+
+                    # Extract all links from the main page
+                    for href, _, _, _ in anchors:
+                        if href and not href.startswith('#') and not href.startswith('javascript:'):
+                            full_url = urljoin(self.base_url, href)
+                            if self.is_valid_url(full_url):
+                                normalized_url = self.normalize_url(full_url)
+                                self.main_page_links.add(normalized_url)
+
+                    # Extract language variants
+                    language_links = self.extract_language_variants(anchors, self.base_url)
+                    for link in language_links:
+                        if self.is_valid_url(link):
+                            normalized_url = self.normalize_url(link)
+                            if normalized_url not in self.visited_urls:
+                                priority_urls.append(normalized_url)
+                                logger.info(f"Added language variant to priority queue: {normalized_url}")
+
+                    # Extract header/menu links
+                    menu_links = self.extract_header_menu_links(menu_hrefs, self.base_url)
+                    for link in menu_links:
+                        if self.is_valid_url(link):
+                            normalized_url = self.normalize_url(link)
+                            if normalized_url not in self.visited_urls:
+                                priority_urls.append(normalized_url)
+                                logger.info(f"Added menu link to priority queue: {normalized_url}")
+
+                    # Extract booking links
+                    booking_links = self.extract_booking_links(anchors, self.base_url)
+                    for link in booking_links:
+                        if self.is_valid_url(link):
+                            normalized_url = self.normalize_url(link)
+                            if normalized_url not in self.visited_urls:
+                                priority_urls.append(normalized_url)
+                                logger.info(f"Added booking link to priority queue: {normalized_url}")
+
+                # Seed the queue: main page first, then priority URLs
+                self._enqueue(queue, self.base_url)
+                for url in priority_urls:
+                    self._enqueue(queue, url)
+
+                # Run a bounded pool of workers over the frontier
+                workers = [
+                    asyncio.create_task(self._worker(session, queue))
+                    for _ in range(CRAWL_WORKERS)
+                ]
+                await queue.join()
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+            logger.info(f"Crawling complete. Visited {len(self.visited_urls)} URLs, kept {self.pages_scraped} pages.")
+            return self._spool_path if self.pages_scraped else None
+
         except Exception as e:
             logger.error(f"Error crawling website: {e}")
-            return self.markdown_content
-    
-    def _process_url(self, url: str) -> List[str]:
-        """Process a single URL and return new URLs to visit"""
+            return self._spool_path if self.pages_scraped else None
+
+        finally:
+            self._spool.close()
+            # A crawl that kept nothing has no caller to clean up after it
+            if not self.pages_scraped:
+                try:
+                    os.remove(self._spool_path)
+                except OSError:
+                    pass
+
+    async def _worker(self, session: aiohttp.ClientSession, queue: asyncio.Queue):
+        """Pull URLs off the queue, process them, and enqueue discoveries"""
+        while True:
+            _, _, entry = await queue.get()
+            try:
+                new_urls = await self._process_url(session, entry)
+                for new_url in new_urls:
+                    self._enqueue(queue, new_url)
+            except Exception as e:
+                logger.error(f"Worker error on {entry.url}: {e}")
+            finally:
+                queue.task_done()
+
+    async def _process_url(self, session: aiohttp.ClientSession, entry: UrlEntry) -> List[str]:
+        """Process a single frontier entry and return new URLs to visit"""
+        url = entry.url
+
         # Skip if already visited
         normalized_url = self.normalize_url(url)
         if normalized_url in self.visited_urls:
             return []
-            
+
         # Mark as visited
         self.visited_urls.add(normalized_url)
-        
+
         # Check if it's a booking URL and we've reached the limit
-        if self.is_booking_url(url):
-            parsed = urlparse(url)
-            if parsed.netloc in self.booking_domains_seen:
+        if entry.is_booking:
+            if entry.netloc in self.booking_domains_seen:
                 # We've already seen this booking domain
                 if self.booking_urls_crawled >= self.max_booking_urls:
                     logger.info(f"Skipping booking URL (reached limit): {url}")
                     return []
             else:
                 # New booking domain
-                self.booking_domains_seen.add(parsed.netloc)
-                
+                self.booking_domains_seen.add(entry.netloc)
+
             self.booking_urls_crawled += 1
-        
-        # Delay to be nice to the server
-        time.sleep(self.delay)
-        
+
         try:
             # Fetch the page
             logger.info(f"Fetching {url}")
-            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
-            
+            body = await self._fetch(session, url)
+
             # Skip if not successful
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch {url}: {response.status_code}")
+            if body is None:
                 return []
-                
-            # Parse the page
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Convert to markdown
-            content = self._html_to_markdown(soup)
-            
-            # Store the content
-            self.markdown_content[url] = content
-            
+
+            # One anchor pass shared by every extractor below
+            anchors, menu_hrefs = self._extract_anchors(body)
+
+            # Convert to markdown off the event loop (this is the only
+            # consumer that needs the full BeautifulSoup tree)
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(self._md_pool, self._html_to_markdown, body)
+
+            # Spool the page straight to disk
+            self._spool.write(_json_dumps({'url': url, 'content': content}) + b'\n')
+            self.pages_scraped += 1
+
             # Extract new URLs
             new_urls = []
-            
+
             # First, check for language variants
-            language_links = self.extract_language_variants(soup, url)
+            language_links = self.extract_language_variants(anchors, url)
             for link in language_links:
                 if self.is_valid_url(link):
                     normalized_link = self.normalize_url(link)
@@ -493,7 +747,7 @@ class WebsiteScraper:
                         logger.info(f"Found language variant: {normalized_link}")
             
             # Then, check for header/menu links
-            menu_links = self.extract_header_menu_links(soup, url)
+            menu_links = self.extract_header_menu_links(menu_hrefs, url)
             for link in menu_links:
                 if self.is_valid_url(link):
                     normalized_link = self.normalize_url(link)
@@ -503,7 +757,7 @@ class WebsiteScraper:
             
             # Extract booking links
             if self.booking_urls_crawled < self.max_booking_urls:
-                booking_links = self.extract_booking_links(soup, url)
+                booking_links = self.extract_booking_links(anchors, url)
                 for link in booking_links:
                     if self.is_valid_url(link):
                         normalized_link = self.normalize_url(link)
@@ -512,13 +766,11 @@ class WebsiteScraper:
                             logger.info(f"Found booking link: {normalized_link}")
             
             # Extract all other links
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag['href']
-                
+            for href, _, _, _ in anchors:
                 # Skip empty or javascript links
                 if not href or href.startswith('#') or href.startswith('javascript:'):
                     continue
-                    
+
                 # Get the full URL
                 full_url = urljoin(url, href)
                 
@@ -534,21 +786,19 @@ class WebsiteScraper:
             logger.error(f"Error processing {url}: {e}")
             return []
     
-    def _html_to_markdown(self, soup) -> str:
-        """Convert HTML to markdown"""
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.extract()
-            
-        # Convert to markdown
-        html = str(soup)
-        markdown = markdownify(html, heading_style="ATX")
-        
-        return markdown
+    def _html_to_markdown(self, body) -> str:
+        """Convert an HTML document to markdown"""
+        tree = lxml_html.fromstring(body)
+
+        # Remove script and style elements in-place on the lxml tree —
+        # cheaper than a BeautifulSoup parse plus str(soup) round-trip
+        etree.strip_elements(tree, 'script', 'style', with_tail=False)
+
+        return markdownify(etree.tostring(tree, encoding='unicode'), heading_style="ATX")
 
 
 def get_website_markdown(url, delay=1.0, max_booking_urls=5):
-    """Scrape a website and convert it to markdown."""
+    """Scrape a website to markdown; returns the path to the page spool."""
     try:
         # Create a scraper instance
         scraper = WebsiteScraper(url, delay, max_booking_urls)
@@ -560,31 +810,26 @@ def get_website_markdown(url, delay=1.0, max_booking_urls=5):
             logger.error(f"URL validation failed for {url}. Stopping processing.")
             return None
         
-        # If the URL was redirected, update the scraper with the new URL
+        # If the URL was redirected, update the scraper with the new URL.
+        # Followed automatically: bare-domain hotel URLs redirect
+        # (http->https, www) almost every time, and concurrent pipelines
+        # cannot share a stdin prompt
         if redirected_url:
             logger.info(f"Following redirect from {url} to {redirected_url}")
-            # Ask the user if they want to follow the redirect
-            print(f"The URL {url} redirects to {redirected_url}")
-            choice = input("Do you want to follow this redirect? (y/n): ").strip().lower()
-            
-            if choice == 'y' or choice == 'yes':
-                # Create a new scraper with the redirected URL
-                scraper = WebsiteScraper(redirected_url, delay, max_booking_urls)
-                url = redirected_url
-            else:
-                logger.info("User chose not to follow the redirect. Stopping processing.")
-                return None
+            # Create a new scraper with the redirected URL
+            scraper = WebsiteScraper(redirected_url, delay, max_booking_urls)
+            url = redirected_url
         
         # Crawl the website
         logger.info(f"Starting to crawl {url}")
-        content = scraper.crawl()
-        
-        if not content:
+        spool_path = scraper.crawl()
+
+        if not spool_path:
             logger.warning(f"No content found for {url}")
             return None
-        
-        logger.info(f"Successfully scraped {len(content)} pages from {url}")
-        return content
+
+        logger.info(f"Successfully scraped {scraper.pages_scraped} pages from {url}")
+        return spool_path
     
     except Exception as e:
         logger.error(f"Error scraping website {url}: {e}")
@@ -593,41 +838,55 @@ def get_website_markdown(url, delay=1.0, max_booking_urls=5):
         return None
 
 
-def save_markdown_content(markdown_content, url):
-    """Save the markdown content to a JSON file."""
+def save_markdown_content(spool_path, url):
+    """Convert the crawl's JSONL page spool into the final JSON file.
+
+    The spool is streamed page by page into the output, so the full
+    content dict is never materialized in memory.
+    """
     try:
         # Create the output directory if it doesn't exist
         output_dir = os.path.join("MCP", "data", "scraped")
         os.makedirs(output_dir, exist_ok=True)
-        
+
         # Generate a unique ID based on the domain name
-        parsed_url = urlparse(url)
+        parsed_url = _parse(url)
         domain = parsed_url.netloc
-        
+
         # Create a more filename-friendly version of the domain
         safe_domain = re.sub(r'[\\/*?:"<>|]', '_', domain)
-        
+
         # Generate a timestamp for uniqueness
         timestamp = int(time.time())
-        
+
         # Create the output filename
         output_filename = f"{safe_domain}_{timestamp}.json"
         output_path = os.path.join(output_dir, output_filename)
-        
-        # Convert to JSON and save
-        output_data = {
-            "url": url,
-            "timestamp": timestamp,
-            "domain": domain,
-            "content": markdown_content
-        }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
+
+        # Stream the spool into the same {url, timestamp, domain,
+        # content} document the rest of the pipeline expects
+        with open(output_path, 'wb') as out, open(spool_path, 'rb') as spool:
+            out.write(b'{"url": ' + _json_dumps(url))
+            out.write(b', "timestamp": ' + _json_dumps(timestamp))
+            out.write(b', "domain": ' + _json_dumps(domain))
+            out.write(b', "content": {')
+            first = True
+            for line in spool:
+                if not line.strip():
+                    continue
+                record = _json_loads(line)
+                if not first:
+                    out.write(b', ')
+                out.write(_json_dumps(record['url']) + b': ' + _json_dumps(record['content']))
+                first = False
+            out.write(b'}}')
+
+        # The spool has served its purpose
+        os.remove(spool_path)
+
         logger.info(f"Content saved to {output_path}")
         return output_path
-    
+
     except Exception as e:
         logger.error(f"Error saving content: {e}")
         return None
@@ -718,15 +977,15 @@ def process_hotel(url, delay=1.0, max_booking_urls=5, min_width=800, min_height=
         
         # Step 1: Scrape website content
         logger.info(f"Step 1: Scraping website content for {url}")
-        markdown_content = get_website_markdown(url, delay, max_booking_urls)
-        
-        if not markdown_content:
+        markdown_spool = get_website_markdown(url, delay, max_booking_urls)
+
+        if not markdown_spool:
             logger.error(f"Failed to scrape content from {url}")
             return False
-        
+
         # Step 2: Save markdown content
         logger.info(f"Step 2: Saving markdown content for {url}")
-        output_path = save_markdown_content(markdown_content, url)
+        output_path = save_markdown_content(markdown_spool, url)
         
         # Step 3: Structure content
         logger.info(f"Step 3: Structuring content for {url}")
@@ -758,44 +1017,93 @@ def process_hotel(url, delay=1.0, max_booking_urls=5, min_width=800, min_height=
         return False
 
 
-def process_hotel_list(urls, delay=1.0, max_booking_urls=5, min_width=800, min_height=600, min_size=50, max_pages=20):
-    """Process a list of hotel URLs sequentially."""
-    results = []
-    
+def iter_urls(path):
+    """Yield non-empty URL lines from a file without materializing the list.
+
+    The file is memory-mapped, so startup cost is independent of list
+    size and multi-MB URL files never sit in memory twice.
+    """
+    with open(path, 'rb') as f:
+        # mmap refuses zero-length files; an empty list is just no URLs
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                stripped = line.strip()
+                if stripped:
+                    yield stripped.decode('utf-8')
+
+
+def process_hotel_list(urls, delay=1.0, max_booking_urls=5, min_width=800, min_height=600, min_size=50, max_pages=20, concurrency=4):
+    """Process an iterable of hotel URLs concurrently."""
+    return asyncio.run(_process_hotel_list_async(
+        urls,
+        delay=delay,
+        max_booking_urls=max_booking_urls,
+        min_width=min_width,
+        min_height=min_height,
+        min_size=min_size,
+        max_pages=max_pages,
+        concurrency=concurrency
+    ))
+
+
+async def _process_hotel_list_async(urls, delay, max_booking_urls, min_width, min_height, min_size, max_pages, concurrency):
+    """Run up to `concurrency` hotel pipelines at once.
+
+    Each hotel's pipeline is synchronous end to end (and the crawl
+    stages spin up their own event loops via asyncio.run), so hotels
+    run in worker threads under a bounded semaphore rather than as
+    coroutines. Per-host politeness inside each crawl makes the old
+    inter-hotel sleep unnecessary. `urls` may be any iterable (e.g. a
+    generator over a memory-mapped file); tasks are scheduled as URLs
+    are read.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bounded(i, url):
+        async with sem:
+            logger.info(f"Processing hotel {i+1}: {url}")
+            success = await asyncio.to_thread(
+                process_hotel,
+                url,
+                delay=delay,
+                max_booking_urls=max_booking_urls,
+                min_width=min_width,
+                min_height=min_height,
+                min_size=min_size,
+                max_pages=max_pages
+            )
+            logger.info(f"Completed hotel {i+1}: {url}")
+            return success
+
+    scheduled = []
+    tasks = []
     for i, url in enumerate(urls):
-        logger.info(f"Processing hotel {i+1}/{len(urls)}: {url}")
-        
-        success = process_hotel(
-            url, 
-            delay=delay, 
-            max_booking_urls=max_booking_urls,
-            min_width=min_width,
-            min_height=min_height,
-            min_size=min_size,
-            max_pages=max_pages
-        )
-        
+        scheduled.append(url)
+        tasks.append(asyncio.ensure_future(bounded(i, url)))
+
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = []
+    for url, outcome in zip(scheduled, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"Error processing hotel {url}: {outcome}")
+            outcome = False
         results.append({
             "url": url,
-            "success": success
+            "success": bool(outcome)
         })
-        
-        logger.info(f"Completed hotel {i+1}/{len(urls)}")
-        
-        # Add a delay between hotels to be nice to servers
-        if i < len(urls) - 1:
-            logger.info(f"Waiting {delay*2} seconds before processing next hotel...")
-            time.sleep(delay * 2)
-    
+
     # Print summary
     logger.info("=== Processing Summary ===")
     successful = sum(1 for r in results if r["success"])
-    logger.info(f"Successfully processed {successful}/{len(urls)} hotels")
-    
+    logger.info(f"Successfully processed {successful}/{len(results)} hotels")
+
     for i, result in enumerate(results):
         status = "✓ Success" if result["success"] else "✗ Failed"
         logger.info(f"{i+1}. {result['url']} - {status}")
-    
+
     return results
 
 
@@ -811,6 +1119,7 @@ def main():
     parser.add_argument("--min-height", "-H", type=int, default=600, help="Minimum image height in pixels")
     parser.add_argument("--min-size", "-s", type=int, default=50, help="Minimum image size in KB")
     parser.add_argument("--max-pages", "-p", type=int, default=20, help="Maximum number of pages to crawl for images")
+    parser.add_argument("--concurrency", "-c", type=int, default=4, help="Number of hotels to process concurrently")
     
     args = parser.parse_args()
     
@@ -830,24 +1139,20 @@ def main():
     # Process a list of URLs from a file
     if args.file:
         try:
-            with open(args.file, 'r') as f:
-                urls = [line.strip() for line in f if line.strip()]
-            
-            if not urls:
-                logger.error(f"No URLs found in {args.file}")
-                sys.exit(1)
-            
-            logger.info(f"Found {len(urls)} URLs in {args.file}")
-            process_hotel_list(
-                urls, 
-                delay=args.delay, 
+            results = process_hotel_list(
+                iter_urls(args.file),
+                delay=args.delay,
                 max_booking_urls=args.max_booking,
                 min_width=args.min_width,
                 min_height=args.min_height,
                 min_size=args.min_size,
-                max_pages=args.max_pages
+                max_pages=args.max_pages,
+                concurrency=args.concurrency
             )
-        
+            if not results:
+                logger.error(f"No URLs found in {args.file}")
+                sys.exit(1)
+
         except Exception as e:
             logger.error(f"Error processing URL list: {e}")
             sys.exit(1)
@@ -891,20 +1196,17 @@ def main():
             print("Enter the path to the file containing URLs (one per line):")
             file_path = input("> ").strip()
             if file_path and os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    urls = [line.strip() for line in f if line.strip()]
-                
-                if urls:
-                    process_hotel_list(
-                        urls, 
-                        delay=args.delay, 
-                        max_booking_urls=args.max_booking,
-                        min_width=args.min_width,
-                        min_height=args.min_height,
-                        min_size=args.min_size,
-                        max_pages=args.max_pages
-                    )
-                else:
+                results = process_hotel_list(
+                    iter_urls(file_path),
+                    delay=args.delay,
+                    max_booking_urls=args.max_booking,
+                    min_width=args.min_width,
+                    min_height=args.min_height,
+                    min_size=args.min_size,
+                    max_pages=args.max_pages,
+                    concurrency=args.concurrency
+                )
+                if not results:
                     print(f"No URLs found in {file_path}")
             else:
                 print(f"File not found: {file_path}")
@@ -1,13 +1,33 @@
 import os
 import json
-import glob
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 import argparse
+import hashlib
 import pathlib
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import asyncio
 import requests  # Use requests instead of OpenAI client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 # Load environment variables
 load_dotenv()
@@ -16,55 +36,94 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def load_json_files(directory: str, specific_files: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-    """Load JSON files from the specified directory, optionally filtering by filename."""
-    json_files = glob.glob(os.path.join(directory, "*.json"))
-    
+# Pooled session for OpenAI calls — keep-alive amortizes the TLS
+# handshake to one per process instead of one per request, and retries
+# transient API failures with backoff
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+def _scan_json_files(directory: str) -> List[str]:
+    """Enumerate *.json files with os.scandir, avoiding per-entry stats."""
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()]
+
+def _load_one(file_path: str):
+    """Read and parse a single JSON file; returns None on failure."""
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        logger.info(f"Loaded {file_path} successfully")
+        return file_path, data
+    except Exception as e:
+        logger.error(f"Error loading {file_path}: {e}")
+        return None
+
+def load_json_files(directory: str, specific_files: Optional[List[str]] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """Load JSON files from the specified directory, optionally filtering by filename.
+
+    Returns a list of (file_path, parsed dict) pairs; files that fail
+    to load are skipped.
+    """
+    json_files = _scan_json_files(directory)
+
     # Filter files if specific ones are requested
     if specific_files:
         # Convert to set of basenames for faster lookup
         specific_basenames = {os.path.basename(f) for f in specific_files}
         json_files = [f for f in json_files if os.path.basename(f) in specific_basenames]
-    
+
     logger.info(f"Found {len(json_files)} JSON files to process in {directory}")
-    
-    # Return list of tuples with (file_path, data)
-    result = []
-    for file_path in json_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                result.append((file_path, data))
-                logger.info(f"Loaded {file_path} successfully")
-        except Exception as e:
-            logger.error(f"Error loading {file_path}: {e}")
-    
-    return result
 
-def structure_content(file_path: str, content_data: Dict[str, Any]) -> str:
-    """Use direct API call to OpenAI instead of using clients with version conflicts."""
-    unique_id = os.path.splitext(os.path.basename(file_path))[0]
-    
-    # Get API key and model configuration
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or api_key == "your_api_key_here":
-        raise ValueError("OPENAI_API_KEY environment variable not set or invalid")
-    
-    model_name = os.getenv("MODEL_NAME", "gpt-4o-mini")
-    temperature = float(os.getenv("LLM_TEMPERATURE", "0.2"))
-    
-    logger.info(f"Using model: {model_name} with temperature: {temperature}")
-    
-    # Create the system prompt
-    system_prompt = """
+    # Read and parse in a thread pool so disk I/O overlaps; orjson cuts
+    # the per-file parse cost where available
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        return [pair for pair in executor.map(_load_one, json_files) if pair is not None]
+
+# OpenAI endpoints used by the sync, async and batch paths
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_FILES_URL = "https://api.openai.com/v1/files"
+OPENAI_BATCHES_URL = "https://api.openai.com/v1/batches"
+
+# On-disk cache of structured results keyed by (model, temperature,
+# content) — re-runs over unchanged content skip the OpenAI call entirely
+_CACHE_DIR = os.path.join("MCP", "data", ".llm_cache")
+
+# Loose schema for the structured document — compiled once so each
+# result is validated in a single pass instead of parse-and-hope
+_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "property": {"type": "object"},
+        "rooms": {"type": "array"},
+        "amenities": {"type": "object"},
+        "policies": {"type": "object"},
+        "location": {"type": "object"},
+    },
+    "required": ["property"],
+}
+_VALIDATE = fastjsonschema.compile(_SCHEMA) if fastjsonschema is not None else None
+
+# Markdown code-fence markers the model sometimes wraps its JSON in
+_FENCE_RE = re.compile(r'```(?:json)?\s*')
+
+# URL pattern and hotel-ish terms for website extraction from raw content
+_URL_RE = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+')
+_HOTEL_TERMS = ('hotel', 'resort', 'inn', 'accommodation', 'booking', 'stay', 'room')
+
+# The extraction prompt sent with every structuring request
+_SYSTEM_PROMPT = """
     You are an expert data extractor for accommodation websites. Your task is to extract and structure 
     information from the provided website content into a detailed JSON format.
     
     IMPORTANT: Translate ALL information into English, regardless of the original language of the content.
-    
-    CRITICAL: You MUST return ONLY valid, parseable JSON. Do not include any explanations, markdown formatting, 
-    or code blocks. The output should be a raw JSON object that can be directly parsed by json.loads().
-    
+
     Extract the following information (if available):
     
     1. Basic Information:
@@ -192,179 +251,495 @@ def structure_content(file_path: str, content_data: Dict[str, Any]) -> str:
     FINAL CHECK: Verify that your output is valid JSON before submitting. Do not include any text outside the JSON object.
     Do not include the triple backticks or json keyword. Return ONLY the raw JSON object.
     """
-    
-    # Convert the data to a string representation
-    content_str = json.dumps(content_data, indent=2)
-    
-    # Truncate if too large
-    if len(content_str) > 30000:
-        logger.warning("Content too large, truncating to 30,000 characters")
-        content_str = content_str[:30000] + "...[truncated]"
-    
-    # Direct API call using requests
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    
-    payload = {
+
+def _dumps_pretty(obj) -> bytes:
+    """Indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _require_api_key() -> str:
+    """Read and validate the OpenAI API key from the environment."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key or api_key == "your_api_key_here":
+        raise ValueError("OPENAI_API_KEY environment variable not set or invalid")
+    return api_key
+
+def _build_payload(content_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the chat-completions payload for a scraped content dict."""
+    model_name = os.getenv("MODEL_NAME", "gpt-4o-mini")
+    temperature = float(os.getenv("LLM_TEMPERATURE", "0.2"))
+
+    logger.info(f"Using model: {model_name} with temperature: {temperature}")
+
+    # Convert the data to a compact byte representation and cap it
+    # there — no point pretty-printing megabytes that get sliced away
+    content_bytes = orjson.dumps(content_data) if orjson is not None \
+        else json.dumps(content_data).encode('utf-8')
+    if len(content_bytes) > 30000:
+        logger.warning("Content too large, truncating to 30,000 bytes")
+        content_bytes = content_bytes[:30000] + b"...[truncated]"
+    content_str = content_bytes.decode('utf-8', 'replace')
+
+    return {
         "model": model_name,
         "messages": [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": content_str}
         ],
-        "temperature": temperature
+        "temperature": temperature,
+        # JSON mode: the API guarantees parseable output, so the
+        # fence-strip repair path is only hit by models that lack it
+        "response_format": {"type": "json_object"}
     }
-    
-    try:
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload
+
+# Results already produced in this run, keyed by content hash — duplicate
+# URLs in the input reuse the first answer instead of paying for another
+# OpenAI call
+_SEEN: Dict[str, Dict[str, Any]] = {}
+
+def _content_fingerprint(content_data: Dict[str, Any]):
+    """Return (encoded blob, sha256 hex) for a scraped content dict."""
+    blob = orjson.dumps(content_data) if orjson is not None \
+        else json.dumps(content_data, sort_keys=True).encode('utf-8')
+    return blob, hashlib.sha256(blob).hexdigest()
+
+def _short_circuit(content_data: Dict[str, Any], unique_id: str, file_path: str):
+    """Return a result without calling the API for trivially empty or
+    already-seen content; None means the call has to happen."""
+    blob, fingerprint = _content_fingerprint(content_data)
+    if len(blob) < 200:
+        logger.warning(f"Content for {os.path.basename(file_path)} is near-empty, skipping LLM call")
+        return fingerprint, _error_doc(
+            unique_id,
+            "empty content",
+            "The scraped content was too small to structure.",
+            content_data
         )
-        
+    seen = _SEEN.get(fingerprint)
+    if seen is not None:
+        logger.info(f"Duplicate content for {os.path.basename(file_path)}, reusing earlier result")
+        duplicate = dict(seen)
+        duplicate["id"] = unique_id
+        return fingerprint, duplicate
+    return fingerprint, None
+
+def _remember(fingerprint: str, result: Dict[str, Any]):
+    """Record a successful result for duplicate detection in this run."""
+    if "error" not in result:
+        _SEEN[fingerprint] = result
+
+def _cache_path(payload: Dict[str, Any]) -> str:
+    """Cache file path for a chat payload, keyed by model/temperature/content."""
+    key = hashlib.sha256(
+        f"{payload['model']}|{payload['temperature']}|{payload['messages'][1]['content']}".encode('utf-8')
+    ).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{key}.json")
+
+def _cache_get(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the cached structured document for a payload, if any."""
+    try:
+        cache_path = _cache_path(payload)
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception as e:
+        logger.warning(f"Could not read LLM cache entry: {e}")
+    return None
+
+def _cache_put(payload: Dict[str, Any], result: Dict[str, Any]):
+    """Store a structured document in the cache, atomically."""
+    # Only cache non-error output
+    if "error" in result:
+        return
+
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        cache_path = _cache_path(payload)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(result) if orjson is not None
+                    else json.dumps(result).encode('utf-8'))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write LLM cache entry: {e}")
+
+def _error_doc(unique_id: str, error: str, description: str, content_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the fallback error document returned when structuring fails."""
+    return {
+        "id": unique_id,
+        "error": error,
+        "property": {
+            "name": "Error processing content",
+            "description": description,
+            "contact": {
+                "website": extract_website_from_content(content_data)
+            }
+        }
+    }
+
+def _validate_and_patch(result: str, unique_id: str) -> Dict[str, Any]:
+    """Parse one time, check against the compiled schema, and patch the
+    ID. Raises ValueError on invalid output."""
+    parsed_json = orjson.loads(result) if orjson is not None else json.loads(result)
+    if _VALIDATE is not None:
+        _VALIDATE(parsed_json)
+
+    # Ensure the ID is included
+    parsed_json.setdefault("id", unique_id)
+    return parsed_json
+
+def _postprocess_result(result: str, unique_id: str, file_path: str, content_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate (and where possible repair) the model's JSON output."""
+    # orjson/json decode errors and fastjsonschema violations are all
+    # ValueError subclasses
+    try:
+        parsed = _validate_and_patch(result, unique_id)
+        logger.info(f"Successfully structured content for {os.path.basename(file_path)} with ID: {unique_id}")
+        return parsed
+    except ValueError as e:
+        # If parsing fails, try to fix common issues
+        logger.warning(f"Generated content is not valid JSON. Attempting to fix: {e}")
+
+        # Remove any markdown code block markers in one pass
+        result = _FENCE_RE.sub('', result).strip()
+
+        # Try parsing again
+        try:
+            parsed = _validate_and_patch(result, unique_id)
+            logger.info("Fixed JSON formatting issues")
+            return parsed
+        except ValueError:
+            # If still invalid, return error JSON
+            logger.error("Could not fix JSON formatting issues")
+            return _error_doc(
+                unique_id,
+                "The LLM did not generate valid JSON",
+                "The content could not be properly structured.",
+                content_data
+            )
+
+def structure_content(file_path: str, content_data: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
+    """Use direct API call to OpenAI instead of using clients with version conflicts."""
+    unique_id = os.path.splitext(os.path.basename(file_path))[0]
+
+    # Empty and duplicate inputs never reach the network
+    fingerprint, early = _short_circuit(content_data, unique_id, file_path)
+    if early is not None:
+        return early
+
+    api_key = _require_api_key()
+
+    # Set the auth headers on the shared session once
+    if "Authorization" not in _SESSION.headers:
+        _SESSION.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        })
+
+    try:
+        payload = _build_payload(content_data)
+
+        if use_cache:
+            cached = _cache_get(payload)
+            if cached is not None:
+                logger.info(f"LLM cache hit for {os.path.basename(file_path)}")
+                return cached
+
+        # Encode the request and decode the response with orjson when
+        # available rather than requests' stdlib-json paths
+        if orjson is not None:
+            response = _SESSION.post(OPENAI_CHAT_URL, data=orjson.dumps(payload), timeout=60)
+        else:
+            response = _SESSION.post(OPENAI_CHAT_URL, json=payload, timeout=60)
+
         if response.status_code != 200:
             error_msg = f"OpenAI API error: {response.status_code} - {response.text}"
             logger.error(error_msg)
             raise Exception(error_msg)
-        
+
+        logger.debug(f"OpenAI call took {response.elapsed.total_seconds():.2f}s")
+
         # Extract the result
-        result = response.json()["choices"][0]["message"]["content"]
-        
-        # Validate JSON before returning
-        try:
-            # Try to parse the result as JSON
-            parsed_json = json.loads(result)
-            
-            # Ensure the ID is included
-            if "id" not in parsed_json:
-                parsed_json["id"] = unique_id
-                result = json.dumps(parsed_json)
-                
-            logger.info(f"Successfully structured content for {os.path.basename(file_path)} with ID: {unique_id}")
-            return result
-        except json.JSONDecodeError as e:
-            # If parsing fails, try to fix common issues
-            logger.warning(f"Generated content is not valid JSON. Attempting to fix: {e}")
-            
-            # Remove any markdown code block markers
-            result = re.sub(r'```json\s*', '', result)
-            result = re.sub(r'```\s*', '', result)
-            
-            # Try parsing again
-            try:
-                parsed_json = json.loads(result)
-                
-                # Ensure the ID is included
-                if "id" not in parsed_json:
-                    parsed_json["id"] = unique_id
-                    result = json.dumps(parsed_json)
-                    
-                logger.info("Fixed JSON formatting issues")
-                return result
-            except json.JSONDecodeError:
-                # If still invalid, return error JSON
-                logger.error("Could not fix JSON formatting issues")
-                error_json = {
-                    "id": unique_id,
-                    "error": "The LLM did not generate valid JSON",
-                    "property": {
-                        "name": "Error processing content",
-                        "description": "The content could not be properly structured.",
-                        "contact": {
-                            "website": extract_website_from_content(content_data)
-                        }
-                    }
-                }
-                return json.dumps(error_json)
+        body = orjson.loads(response.content) if orjson is not None else response.json()
+        result = body["choices"][0]["message"]["content"]
+
+        structured = _postprocess_result(result, unique_id, file_path, content_data)
+        _remember(fingerprint, structured)
+        if use_cache:
+            _cache_put(payload, structured)
+        return structured
     except Exception as e:
         error_msg = f"Error structuring content: {e}"
         logger.error(error_msg)
-        error_json = {
-            "id": unique_id,
-            "error": error_msg,
-            "property": {
-                "name": "Error processing content",
-                "description": "An error occurred during processing.",
-                "contact": {
-                    "website": extract_website_from_content(content_data)
-                }
-            }
-        }
-        return json.dumps(error_json)
+        return _error_doc(unique_id, error_msg, "An error occurred during processing.", content_data)
+
+async def structure_content_async(client, file_path: str, content_data: Dict[str, Any], use_cache: bool = True, executor=None) -> Dict[str, Any]:
+    """Async twin of structure_content sharing one httpx.AsyncClient.
+
+    When `executor` is given, the CPU-bound parse/validate step runs
+    there instead of on the event loop.
+    """
+    unique_id = os.path.splitext(os.path.basename(file_path))[0]
+
+    # Empty and duplicate inputs never reach the network
+    fingerprint, early = _short_circuit(content_data, unique_id, file_path)
+    if early is not None:
+        return early
+
+    try:
+        payload = _build_payload(content_data)
+
+        if use_cache:
+            cached = _cache_get(payload)
+            if cached is not None:
+                logger.info(f"LLM cache hit for {os.path.basename(file_path)}")
+                return cached
+
+        if orjson is not None:
+            response = await client.post(
+                OPENAI_CHAT_URL,
+                content=orjson.dumps(payload),
+                timeout=httpx.Timeout(60.0)
+            )
+        else:
+            response = await client.post(
+                OPENAI_CHAT_URL,
+                json=payload,
+                timeout=httpx.Timeout(60.0)
+            )
+
+        if response.status_code != 200:
+            error_msg = f"OpenAI API error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        # Extract the result
+        body = orjson.loads(response.content) if orjson is not None else response.json()
+        result = body["choices"][0]["message"]["content"]
+
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+            structured = await loop.run_in_executor(
+                executor, _postprocess_result, result, unique_id, file_path, content_data
+            )
+        else:
+            structured = _postprocess_result(result, unique_id, file_path, content_data)
+        _remember(fingerprint, structured)
+        if use_cache:
+            _cache_put(payload, structured)
+        return structured
+    except Exception as e:
+        error_msg = f"Error structuring content: {e}"
+        logger.error(error_msg)
+        return _error_doc(unique_id, error_msg, "An error occurred during processing.", content_data)
+
+async def _structure_batch_async(file_data_pairs, output_dir: str, use_cache: bool = True):
+    """Structure a batch of files concurrently against the OpenAI API."""
+    api_key = _require_api_key()
+    sem = asyncio.Semaphore(int(os.getenv("LLM_CONCURRENCY", "8")))
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}"
+    }
+
+    # Validation, repair and serialization are pure CPU — on large
+    # batches push them to worker processes so they use all cores
+    # instead of competing with in-flight requests under the GIL
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        async with httpx.AsyncClient(http2=True, headers=headers) as client:
+            async def bounded(file_path, data):
+                async with sem:
+                    structured = await structure_content_async(
+                        client, file_path, data, use_cache=use_cache, executor=executor
+                    )
+                # Keep the event loop free while the result hits disk
+                await asyncio.to_thread(save_structured_content, structured, file_path, output_dir)
+
+            await asyncio.gather(*(bounded(fp, d) for fp, d in file_data_pairs))
 
 def extract_website_from_content(content_data: Dict[str, Any]) -> str:
     """Extract a website URL from the content data if possible."""
     try:
-        # Convert to string and search for URLs
-        content_str = json.dumps(content_data)
-        import re
-        url_pattern = r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'
-        urls = re.findall(url_pattern, content_str)
-        
-        # Filter for likely hotel website URLs
-        hotel_urls = [url for url in urls if any(term in url.lower() for term in 
-                     ['hotel', 'resort', 'inn', 'accommodation', 'booking', 'stay', 'room'])]
-        
-        if hotel_urls:
-            return hotel_urls[0]
-        elif urls:
-            return urls[0]
-        else:
-            return ""
+        # Convert to string and scan for URLs, returning the first one
+        # that looks like a hotel site without building the full list
+        content_str = orjson.dumps(content_data).decode('utf-8') if orjson is not None \
+            else json.dumps(content_data)
+        first = ""
+        for match in _URL_RE.finditer(content_str):
+            url = match.group(0)
+            if any(term in url.lower() for term in _HOTEL_TERMS):
+                return url
+            if not first:
+                first = url
+        return first
     except:
         return ""
 
-def save_structured_content(content: str, input_file_path: str, output_dir: str):
-    """Save the structured content to a JSON file with the same base name as the input file."""
+def _write_atomic(output_path: str, payload: bytes):
+    """Write bytes to a temp file and os.replace it into place.
+
+    A crash mid-write leaves the old file (or nothing) rather than a
+    truncated JSON document that would force re-running the LLM step.
+    """
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, output_path)
+
+def save_structured_content(content: Dict[str, Any], input_file_path: str, output_dir: str):
+    """Save a structured document to a JSON file with the same base name as the input file.
+
+    `content` is the already-parsed dict from structure_content — no
+    second parse/serialize round-trip happens here.
+    """
     os.makedirs(output_dir, exist_ok=True)
-    
+
     # Get the original filename and use it for the output
     input_filename = os.path.basename(input_file_path)
     output_path = os.path.join(output_dir, input_filename)
-    
-    # Ensure the content is valid JSON
+
+    # Write the formatted JSON to the output file
+    _write_atomic(output_path, _dumps_pretty(content))
+
+    logger.info(f"Saved structured content to {output_path}")
+    return output_path
+
+def _structure_batch_api(file_data_pairs, output_dir: str, use_cache: bool = True, poll_interval: int = 30):
+    """Run a bulk job through the OpenAI Batch API.
+
+    One JSONL upload replaces one HTTPS round-trip per file, and batch
+    processing is billed at roughly half the synchronous rate — the
+    right trade for nightly --all runs where latency does not matter.
+    Cached, empty and duplicate files are settled locally before upload.
+    """
+    api_key = _require_api_key()
+    headers = {"Authorization": f"Bearer {api_key}"}
+
+    # Settle everything we can without the network, collect the rest
+    pending = {}
+    lines = []
+    for file_path, content_data in file_data_pairs:
+        unique_id = os.path.splitext(os.path.basename(file_path))[0]
+
+        fingerprint, early = _short_circuit(content_data, unique_id, file_path)
+        if early is not None:
+            save_structured_content(early, file_path, output_dir)
+            continue
+
+        payload = _build_payload(content_data)
+        if use_cache:
+            cached = _cache_get(payload)
+            if cached is not None:
+                logger.info(f"LLM cache hit for {os.path.basename(file_path)}")
+                save_structured_content(cached, file_path, output_dir)
+                continue
+
+        pending[unique_id] = (file_path, content_data, fingerprint, payload)
+        envelope = {
+            "custom_id": unique_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": payload
+        }
+        lines.append(orjson.dumps(envelope) if orjson is not None
+                     else json.dumps(envelope).encode('utf-8'))
+
+    if not pending:
+        logger.info("Nothing to submit — every file was cached or skipped")
+        return
+
     try:
-        # Parse the content to ensure it's valid JSON
-        json_content = json.loads(content)
-        
-        # Write the formatted JSON to the output file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_content, f, indent=2, ensure_ascii=False)
-        
-        logger.info(f"Saved structured content to {output_path}")
-        return output_path
-    except json.JSONDecodeError:
-        # If the content isn't valid JSON, try to fix it or create a minimal valid JSON
-        logger.error(f"Generated content is not valid JSON. Attempting to fix...")
-        
-        # Create a minimal valid JSON with error information
-        fallback_json = {
-            "error": "The LLM did not generate valid JSON",
-            "property": {
-                "name": "Error processing content",
-                "description": "The content could not be properly structured."
+        # Upload the request file and open the batch
+        upload = requests.post(
+            OPENAI_FILES_URL,
+            headers=headers,
+            files={"file": ("batch.jsonl", b"\n".join(lines), "application/jsonl")},
+            data={"purpose": "batch"},
+            timeout=120
+        )
+        upload.raise_for_status()
+        input_file_id = upload.json()["id"]
+
+        create = requests.post(
+            OPENAI_BATCHES_URL,
+            headers=headers,
+            json={
+                "input_file_id": input_file_id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h"
             },
-            "rawContent": content[:1000] + "..." if len(content) > 1000 else content
-        }
-        
-        # Save the fallback JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(fallback_json, f, indent=2, ensure_ascii=False)
-        
-        logger.info(f"Saved fallback JSON to {output_path}")
-        return output_path
+            timeout=60
+        )
+        create.raise_for_status()
+        batch_id = create.json()["id"]
+        logger.info(f"Submitted batch {batch_id} with {len(pending)} requests")
+
+        # Poll until the batch reaches a terminal state
+        while True:
+            time.sleep(poll_interval)
+            status = requests.get(f"{OPENAI_BATCHES_URL}/{batch_id}", headers=headers, timeout=60).json()
+            state = status.get("status")
+            logger.info(f"Batch {batch_id}: {state}")
+            if state in ("completed", "failed", "expired", "cancelled"):
+                break
+
+        if state == "completed" and status.get("output_file_id"):
+            output = requests.get(
+                f"{OPENAI_FILES_URL}/{status['output_file_id']}/content",
+                headers=headers,
+                timeout=120
+            )
+            output.raise_for_status()
+
+            # Feed each result through the normal validate/save path
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
+                entry = pending.pop(record.get("custom_id"), None)
+                if entry is None:
+                    continue
+                file_path, content_data, fingerprint, payload = entry
+                unique_id = record["custom_id"]
+                try:
+                    body = record["response"]["body"]
+                    result = body["choices"][0]["message"]["content"]
+                except (KeyError, IndexError, TypeError):
+                    continue
+                structured = _postprocess_result(result, unique_id, file_path, content_data)
+                _remember(fingerprint, structured)
+                if use_cache:
+                    _cache_put(payload, structured)
+                save_structured_content(structured, file_path, output_dir)
+        else:
+            logger.error(f"Batch {batch_id} ended in state {state}")
+    except Exception as e:
+        logger.error(f"Error running batch job: {e}")
+
+    # Whatever never came back gets an error stub so downstream steps
+    # see a complete output directory
+    for unique_id, (file_path, content_data, fingerprint, payload) in pending.items():
+        stub = _error_doc(
+            unique_id,
+            "Batch request did not return a result",
+            "An error occurred during batch processing.",
+            content_data
+        )
+        save_structured_content(stub, file_path, output_dir)
 
 def list_available_files(directory: str) -> List[str]:
     """List all JSON files in the directory."""
-    json_files = glob.glob(os.path.join(directory, "*.json"))
-    return [os.path.basename(f) for f in json_files]
+    return [os.path.basename(f) for f in _scan_json_files(directory)]
 
 def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(description="Structure accommodation website content")
     parser.add_argument("--files", "-f", nargs="+", help="Specific files to process (optional)")
     parser.add_argument("--all", "-a", action="store_true", help="Process all files")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk LLM result cache")
+    parser.add_argument("--batch", action="store_true", help="Submit one OpenAI Batch API job instead of per-file requests")
     args = parser.parse_args()
     
     # Define paths
@@ -415,14 +790,20 @@ def main():
         logger.warning("No files were loaded. Please check your selection.")
         return
     
-    # Process each file individually
-    for file_path, data in file_data_pairs:
-        # Structure the content
-        structured_content = structure_content(file_path, data)
-        
-        # Save the structured content to an individual file
-        save_structured_content(structured_content, file_path, output_dir)
-    
+    # Batch API for bulk runs, otherwise concurrent requests when httpx
+    # is available, otherwise the serial path
+    if args.batch:
+        _structure_batch_api(file_data_pairs, output_dir, use_cache=not args.no_cache)
+    elif httpx is not None:
+        asyncio.run(_structure_batch_async(file_data_pairs, output_dir, use_cache=not args.no_cache))
+    else:
+        for file_path, data in file_data_pairs:
+            # Structure the content
+            structured_content = structure_content(file_path, data, use_cache=not args.no_cache)
+
+            # Save the structured content to an individual file
+            save_structured_content(structured_content, file_path, output_dir)
+
     logger.info("Content structuring complete!")
 
 if __name__ == "__main__":